@@ -7,6 +7,6 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __description__ = "A powerful MCP server that brings Selenium WebDriver automation to AI assistants"
 
-from .selenium_mcp_server import SeleniumMCPServer, main
+from .selenium_mcp_server import SeleniumMCPServer, main, run
 
-__all__ = ["SeleniumMCPServer", "main"] 
\ No newline at end of file
+__all__ = ["SeleniumMCPServer", "main", "run"] 
\ No newline at end of file
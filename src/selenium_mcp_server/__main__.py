@@ -4,15 +4,15 @@ Entry point for running the Selenium MCP Server as a module.
 Usage: python -m selenium_mcp_server
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-# Import and run the main function from selenium_mcp_server
-from selenium_mcp_server import main
+if __package__:
+    from . import run
+else:
+    # Executed as a plain script: make the src directory importable first
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from selenium_mcp_server import run
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run()
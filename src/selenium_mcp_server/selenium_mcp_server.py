@@ -12,17 +12,29 @@ This MCP server provides Selenium WebDriver functionality with improvements:
 """
 
 import asyncio
+import base64
+import concurrent.futures
+import functools
+import importlib
 import json
 import logging
 import os
+import stat
 import sys
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass
-from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 
+import anyio
+import anyio.lowlevel
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 
@@ -42,8 +54,13 @@ from mcp.types import (
     ListResourcesRequest,
     ListResourcesResult,
     ReadResourceRequest,
-    ReadResourceResult,
+    JSONRPCMessage,
 )
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+try:
+    from mcp.shared.message import SessionMessage
+except ImportError:  # older mcp releases pass bare JSONRPCMessages; use their stdio_server
+    SessionMessage = None
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -62,8 +79,156 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+
+try:
+    import orjson  # optional, faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Tool-facing locator strategy names
+_BY_MAP = MappingProxyType({
+    "id": By.ID,
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "name": By.NAME,
+    "tag": By.TAG_NAME,
+    "class": By.CLASS_NAME
+})
+_LOCATOR_STRATEGIES = tuple(_BY_MAP)
+
+# Defines locate(by, value): the first element matching a Selenium locator, or
+# null. XPaths are compiled once and kept on the page's window, which the
+# MutationObserver wait re-evaluates on every DOM change; navigation discards
+# the cache, so it is installed lazily.
+_LOCATE_JS = """
+function locate(by, value) {
+    switch (by) {
+        case "id": return document.getElementById(value);
+        case "xpath":
+            var cache = window.__seleniumMcpXPath || (window.__seleniumMcpXPath = new Map());
+            var expr = cache.get(value);
+            if (!expr) {
+                expr = document.createExpression(value, null);
+                cache.set(value, expr);
+            }
+            var node = expr.evaluate(document, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            return node && node.nodeType === Node.ELEMENT_NODE ? node : null;
+        case "name": return document.getElementsByName(value)[0] || null;
+        case "tag name": return document.getElementsByTagName(value)[0] || null;
+        case "class name": return document.getElementsByClassName(value)[0] || null;
+        default: return document.querySelector(value);
+    }
+}
+"""
+
+# Resolves (via the async-script callback) with the first element matching
+# arguments[0]/[1], checking at once and then on every DOM mutation rather
+# than on a polling interval; resolves null after arguments[2] ms
+_AWAIT_ELEMENT_JS = _LOCATE_JS + """
+var by = arguments[0], value = arguments[1], done = arguments[arguments.length - 1];
+var found = locate(by, value);
+if (found) return done(found);
+var timer, observer = new MutationObserver(function () {
+    var el = locate(by, value);
+    if (el) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(el);
+    }
+});
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function () {
+    observer.disconnect();
+    done(null);
+}, arguments[2]);
+"""
+
+# True when arguments[2] is still the first match for arguments[0]/[1] and is
+# rendered and enabled, so a cached element is safe to reuse for a click
+_CACHED_MATCH_JS = _LOCATE_JS + """
+var el = arguments[2];
+if (locate(arguments[0], arguments[1]) !== el) return false;
+return el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden" && !el.disabled;
+"""
+
+# Reads title, URL and (when arguments[0] is set) the serialized document in
+# one round trip; a positive arguments[1] caps the source in the page so an
+# oversized document never crosses the wire. The cap counts UTF-16 units and
+# never splits a surrogate pair; truncated reports whether anything was cut.
+_PAGE_INFO_JS = """
+var info = {title: document.title, url: location.href};
+if (arguments[0]) {
+    var html = document.documentElement.outerHTML, end = arguments[1];
+    info.truncated = end > 0 && html.length > end;
+    if (info.truncated) {
+        var last = html.charCodeAt(end - 1);
+        if (last >= 0xD800 && last <= 0xDBFF) end--;
+        html = html.slice(0, end);
+    }
+    info.source = html;
+}
+return info;
+"""
+
+# Interprets a batch_actions step list in the page, so the whole sequence
+# costs one WebDriver round trip. Steps arrive as arguments[0], with each find
+# step's by already mapped to its Selenium locator strategy.
+_BATCH_ACTIONS_JS = _LOCATE_JS + """
+var steps = arguments[0], results = [], el = null;
+for (var i = 0; i < steps.length; i++) {
+    var step = steps[i];
+    if (step.op === "find") {
+        el = locate(step.by, step.value);
+        if (!el) return {results: results, failed_at: i, error: "Element not found: " + step.value};
+        results.push(true);
+        continue;
+    }
+    if (!el) return {results: results, failed_at: i, error: "No element selected; add a 'find' step first"};
+    switch (step.op) {
+        case "click": el.click(); results.push(true); break;
+        case "text": results.push(el.innerText); break;
+        case "attribute": results.push(el.getAttribute(step.name)); break;
+        default: return {results: results, failed_at: i, error: "Unknown op: " + step.op};
+    }
+}
+return {results: results};
+"""
+
+# Sets the value of a text input or textarea in one round trip, firing the
+# input/change events typing would. The prototype's setter is used so that
+# frameworks tracking the value (React) see the change. Returns false for any
+# other element, or one a user could not type into, so the caller falls back
+# to send_keys.
+_FILL_INPUT_JS = """
+var e = arguments[0], text = arguments[1], clear = arguments[2];
+var typeable = e.tagName === "TEXTAREA" || (e.tagName === "INPUT" &&
+    ["text", "search", "email", "url", "tel", "password"].indexOf(e.type) !== -1);
+if (!typeable || e.readOnly || e.disabled) return false;
+var value = (clear ? "" : e.value) + text;
+if (e.maxLength >= 0) value = value.slice(0, e.maxLength);
+e.focus();
+Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e), "value").set.call(e, value);
+e.dispatchEvent(new Event("input", {bubbles: true}));
+e.dispatchEvent(new Event("change", {bubbles: true}));
+return true;
+"""
+
+# Replays an HTML5 drag (dragstart .. dragend) between arguments[0] and
+# arguments[1] with a shared DataTransfer, since native DnD handlers ignore
+# the synthetic mouse events ActionChains produces.
+_HTML5_DRAG_JS = """
+var source = arguments[0], target = arguments[1];
+var data = new DataTransfer();
+function fire(el, type) {
+    var event = new DragEvent(type, {bubbles: true, cancelable: true, dataTransfer: data});
+    el.dispatchEvent(event);
+}
+fire(source, "dragstart");
+fire(target, "dragenter");
+fire(target, "dragover");
+fire(target, "drop");
+fire(source, "dragend");
+"""
 
 # Configure logging
 logging.basicConfig(
@@ -72,6 +237,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Idle drivers kept per (browser, options) key for reuse by later sessions
+# (0 disables; only Chromium browsers, which can be fully reset, are pooled)
+_DRIVER_POOL_SIZE = int(os.environ.get("SELENIUM_MCP_DRIVER_POOL_SIZE", "0"))
+# Drivers launched in the background ahead of demand for each configuration
+# that has been started at least once (0 disables)
+_WARM_DRIVERS = int(os.environ.get("SELENIUM_MCP_WARM_DRIVERS", "0"))
+# Keep-alive connections the command executor may hold open to the driver
+_COMMAND_POOL_MAXSIZE = 20
+# Sessions idle for longer than this many seconds are closed (0 disables)
+_SESSION_IDLE_TIMEOUT = float(os.environ.get("SELENIUM_MCP_SESSION_IDLE_TIMEOUT", "0"))
+# Open sessions allowed before the least recently used one is closed (0 = unlimited)
+_MAX_SESSIONS = int(os.environ.get("SELENIUM_MCP_MAX_SESSIONS", "0"))
+# Typing time, in ms, that one send_keys command may cover when type_speed is set
+_TYPING_CHUNK_MS = 50
+# Seconds between checks while a tool waits on the page; WebDriverWait's
+# default of 0.5 leaves up to half a second idle after the page is ready
+_POLL_FREQUENCY = 0.05
+# readyState polling after navigate starts at the first interval and doubles up to the second
+_READY_POLL_MIN = 0.025
+_READY_POLL_MAX = 0.2
+# document.readyState values that end the navigate wait, per page load strategy.
+# "normal" is absent because driver.get already returned after the load event,
+# and "none" because it promises to return without waiting.
+_LOAD_READY_STATES = MappingProxyType({"eager": ("interactive", "complete")})
+# Longest single in-page element wait, kept under WebDriver's default 30 s script timeout
+_OBSERVE_CHUNK_MS = 20000
+# Default cap on page source returned by get_page_info
+_MAX_SOURCE_BYTES = 256 * 1024
+# Located elements remembered per session
+_ELEMENT_CACHE_SIZE = 128
+# Threads that run blocking WebDriver calls off the event loop
+_EXECUTOR_WORKERS = 16
+# Browsers start headless unless the caller asks for a window; SELENIUM_MCP_HEADFUL=1
+# makes visible windows the default instead
+_HEADLESS_DEFAULT = os.environ.get("SELENIUM_MCP_HEADFUL", "0") != "1"
+# Tool calls run at once; further calls wait their turn (0 means unlimited)
+_MAX_CONCURRENT_CALLS = int(os.environ.get("SELENIUM_MCP_MAX_CONCURRENT_CALLS", "8"))
+# Longest JSON-RPC line accepted on stdin by the pipe transport
+_STDIO_LINE_LIMIT = 16 * 1024 * 1024
+
+# Shared JSON-Schema fragments for the tool input schemas
+_SCHEMA_URI = "http://json-schema.org/draft-07/schema#"
+_BY_PROP = {
+    "type": "string",
+    "enum": list(_LOCATOR_STRATEGIES),
+    "description": "Locator strategy to find element"
+}
+_VALUE_PROP = {
+    "type": "string",
+    "description": "Value for the locator strategy"
+}
+_TIMEOUT_PROP = {
+    "type": "number",
+    "description": "Maximum time to wait for element in milliseconds"
+}
+
+def _input_schema(properties: Dict[str, Any], required: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build a closed draft-07 object schema for a tool's arguments."""
+    schema = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = required
+    schema["additionalProperties"] = False
+    schema["$schema"] = _SCHEMA_URI
+    return schema
+
+def _locator_schema(extra_properties: Optional[Dict[str, Any]] = None, required: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build the schema for a tool that targets an element via by/value/timeout."""
+    properties = {"by": _BY_PROP, "value": _VALUE_PROP, "timeout": _TIMEOUT_PROP}
+    if extra_properties:
+        properties.update(extra_properties)
+    return _input_schema(properties, ["by", "value"] + (required or []))
+
 class MCPResponse:
     """Standardized MCP response wrapper to fix validation errors."""
     
@@ -115,6 +352,28 @@ class MCPResponse:
             is_error=True
         )
 
+def _json_default(value: Any) -> str:
+    """Stand-in for values JSON has no type for, such as WebElements returned by scripts."""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default)
+
+@functools.lru_cache(maxsize=1)
+def _get_package_version() -> str:
+    """Return the installed package version, resolved once per process."""
+    try:
+        from importlib.metadata import version as pkg_version
+    except ImportError:
+        from importlib_metadata import version as pkg_version  # type: ignore
+    try:
+        return pkg_version("selenium-mcp-server")
+    except Exception:
+        return "unknown"
+
 class SeleniumMCPError(Exception):
     """Custom exception for Selenium MCP errors."""
     def __init__(self, message: str, error_code: str = None, suggestion: str = None):
@@ -143,6 +402,89 @@ def safe_execute(func):
             ).to_dict()
     return wrapper
 
+# webdriver-manager (and the HTTP stack it pulls in) is only imported when a
+# driver actually has to be resolved
+_DRIVER_MANAGERS = {
+    "chrome": ("webdriver_manager.chrome", "ChromeDriverManager"),
+    "firefox": ("webdriver_manager.firefox", "GeckoDriverManager"),
+}
+# Resolved driver binaries, remembered across runs to skip webdriver-manager's version lookups
+_DRIVER_CACHE_FILE = Path.home() / ".cache" / "selenium-mcp" / "drivers.json"
+# Launches run on executor threads; serialize resolution so concurrent first
+# launches don't each run webdriver-manager or race on the cache file
+_DRIVER_RESOLVE_LOCK = threading.Lock()
+
+def _write_bytes(path: str, data: bytes):
+    """Write data to path through the raw file descriptor, skipping Python's buffered writer."""
+    # O_BINARY keeps Windows from translating newlines in the image bytes
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _read_driver_cache() -> Dict[str, str]:
+    """Load the on-disk driver path cache, treating any problem as an empty cache."""
+    try:
+        with open(_DRIVER_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_driver_cache(cache: Dict[str, str]):
+    """Persist the driver path cache; failures only cost a lookup next run."""
+    try:
+        _DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_DRIVER_CACHE_FILE, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not write driver cache: {e}")
+
+@functools.lru_cache(maxsize=4)
+def _resolve_driver(browser: str) -> str:
+    """Return the driver binary path for browser, resolved at most once per process."""
+    with _DRIVER_RESOLVE_LOCK:
+        cache = _read_driver_cache()
+        path = cache.get(browser)
+        if path and os.path.isfile(path):
+            return path
+        module_name, class_name = _DRIVER_MANAGERS[browser]
+        manager = getattr(importlib.import_module(module_name), class_name)
+        path = manager().install()
+        cache[browser] = path
+        _write_driver_cache(cache)
+        return path
+
+def _forget_driver(browser: str):
+    """Drop a remembered driver path so the next launch resolves it again."""
+    with _DRIVER_RESOLVE_LOCK:
+        _resolve_driver.cache_clear()
+        cache = _read_driver_cache()
+        if cache.pop(browser, None) is not None:
+            _write_driver_cache(cache)
+
+@functools.lru_cache(maxsize=32)
+def _browser_arguments(browser: str, headless: bool, additional_args: Tuple[str, ...],
+                       window_size: Optional[Tuple[int, int]], disable_images: bool = False) -> Tuple[str, ...]:
+    """Command-line arguments for a browser launch, computed once per configuration."""
+    if browser == "chrome":
+        # --no-sandbox is deliberately not implied: it turns off Chrome's renderer
+        # sandbox, so containers running as root must pass it in arguments themselves
+        args = ["--headless=new", "--disable-gpu", "--disable-dev-shm-usage"] if headless else []
+        if disable_images:
+            args.append("--blink-settings=imagesEnabled=false")
+        args.extend(additional_args)
+        if window_size:
+            args.append(f"--window-size={window_size[0]},{window_size[1]}")
+    else:
+        args = ["--headless"] if headless else []
+        args.extend(additional_args)
+        if window_size:
+            args.extend((f"--width={window_size[0]}", f"--height={window_size[1]}"))
+    return tuple(args)
+
 @dataclass
 class BrowserSession:
     """Represents a browser session with metadata."""
@@ -150,658 +492,530 @@ class BrowserSession:
     driver: webdriver.Remote
     browser_type: str
     created_at: datetime
-    last_activity: datetime
+    last_activity: int  # time.monotonic_ns() of the last tool call
     options: Dict[str, Any]
     url: Optional[str] = None
+    created_ns: int = field(default_factory=time.monotonic_ns)
+    # Elements found on the current page, keyed by (By, value) locator, least recently used first
+    element_cache: "OrderedDict[tuple, Any]" = field(default_factory=OrderedDict)
+    # Lookups run on executor threads, so concurrent tool calls share the cache
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _summary: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    def touch(self):
+        """Record activity on this session without touching the wall clock."""
+        self.last_activity = time.monotonic_ns()
+        self._summary = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Listing fields for this session, rebuilt only after activity."""
+        if self._summary is None:
+            self._summary = {
+                "session_id": self.session_id,
+                "browser_type": self.browser_type,
+                "url": self.url,
+                "created_at": self.created_at.isoformat(),
+                "last_activity": self.last_activity_at.isoformat(),
+            }
+        return self._summary
+
+    def cached_element(self, locator: tuple):
+        """Return the cached element for locator, marking it recently used."""
+        with self._cache_lock:
+            element = self.element_cache.get(locator)
+            if element is not None:
+                self.element_cache.move_to_end(locator)
+            return element
+
+    def cache_element(self, locator: tuple, element):
+        """Remember element for locator, dropping the least recently used entries past the cap."""
+        with self._cache_lock:
+            self.element_cache[locator] = element
+            self.element_cache.move_to_end(locator)
+            while len(self.element_cache) > _ELEMENT_CACHE_SIZE:
+                self.element_cache.popitem(last=False)
+
+    def forget_element(self, locator: tuple):
+        """Drop the cached element for locator, if any."""
+        with self._cache_lock:
+            self.element_cache.pop(locator, None)
+
+    def forget_elements(self):
+        """Drop every cached element, e.g. after the page changed."""
+        with self._cache_lock:
+            self.element_cache.clear()
+
+    @property
+    def last_activity_at(self) -> datetime:
+        """Wall-clock time of the last activity, derived from the monotonic stamp."""
+        return self.created_at + timedelta(microseconds=(self.last_activity - self.created_ns) / 1000)
 
 class SeleniumMCPServer:
     """MCP Server for Selenium WebDriver operations."""
 
     def __init__(self):
         self.server = Server("selenium-mcp")
-        self.sessions: Dict[str, BrowserSession] = {}
+        # Ordered least to most recently used, so idle sessions sit at the front
+        self.sessions: "OrderedDict[str, BrowserSession]" = OrderedDict()
         self.current_session_id: Optional[str] = None
+        self._driver_pool: Dict[str, List[webdriver.Remote]] = {}
+        self._refill_tasks: Dict[str, asyncio.Task] = {}
+        self._closing = False
+        self._reaper: Optional[asyncio.Task] = None
+        # Created on first use so it binds to the server's running loop
+        self._call_slots: Optional[asyncio.Semaphore] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_EXECUTOR_WORKERS, thread_name_prefix="selenium-mcp"
+        )
+        # Serialized browser-status://sessions body; None once sessions change
+        self._sessions_json: Optional[str] = None
+        self._tool_handlers = {
+            "start_browser": self._start_browser,
+            "list_sessions": self._list_sessions,
+            "switch_session": self._switch_session,
+            "close_session": self._close_session,
+            "navigate": self._navigate,
+            "find_element": self._find_element,
+            "click_element": self._click_element,
+            "send_keys": self._send_keys,
+            "get_element_text": self._get_element_text,
+            "hover": self._hover,
+            "drag_and_drop": self._drag_and_drop,
+            "double_click": self._double_click,
+            "right_click": self._right_click,
+            "press_key": self._press_key,
+            "upload_file": self._upload_file,
+            "take_screenshot": self._take_screenshot,
+            "wait_for_element": self._wait_for_element,
+            "execute_script": self._execute_script,
+            "get_page_info": self._get_page_info,
+            "batch_actions": self._batch_actions,
+            "get_server_version": self._get_server_version,
+        }
         self.setup_tools()
         self.setup_resources()
+        # The advertised tool list and the dispatch table must describe the same tools
+        unmatched = {tool.name for tool in self._tools} ^ self._tool_handlers.keys()
+        if unmatched:
+            raise RuntimeError(f"Tools without a matching definition or handler: {sorted(unmatched)}")
 
     def setup_resources(self):
         """Setup MCP resources for browser status."""
         
+        self._resources = [
+            Resource(
+                uri="browser-status://current",
+                name="Current Browser Status",
+                description="Status of the current browser session",
+                mimeType="text/plain"
+            ),
+            Resource(
+                uri="browser-status://sessions",
+                name="All Sessions",
+                description="List of all browser sessions",
+                mimeType="application/json"
+            )
+        ]
+
         @self.server.list_resources()
         async def handle_list_resources():
             """List available resources."""
-            resources = [
-                Resource(
-                    uri="browser-status://current",
-                    name="Current Browser Status",
-                    description="Status of the current browser session",
-                    mimeType="text/plain"
-                ),
-                Resource(
-                    uri="browser-status://sessions",
-                    name="All Sessions",
-                    description="List of all browser sessions",
-                    mimeType="application/json"
-                )
-            ]
-            return resources
+            return self._resources
 
         @self.server.read_resource()
-        async def handle_read_resource(uri: str) -> ReadResourceResult:
+        async def handle_read_resource(uri) -> List[ReadResourceContents]:
             """Read resource content."""
+            uri = str(uri)
             if uri == "browser-status://current":
                 if self.current_session_id and self.current_session_id in self.sessions:
                     session = self.sessions[self.current_session_id]
-                    content = f"Active session: {session.session_id}\n"
-                    content += f"Browser: {session.browser_type}\n"
-                    content += f"URL: {session.url or 'No URL'}\n"
-                    content += f"Created: {session.created_at}\n"
-                    content += f"Last activity: {session.last_activity}"
+                    content = (
+                        f"Active session: {session.session_id}\n"
+                        f"Browser: {session.browser_type}\n"
+                        f"URL: {session.url or 'No URL'}\n"
+                        f"Created: {session.created_at}\n"
+                        f"Last activity: {session.last_activity_at}"
+                    )
                 else:
                     content = "No active browser session"
                 
-                return ReadResourceResult(
-                    contents=[{
-                        "uri": uri,
-                        "text": content
-                    }]
-                )
+                return [ReadResourceContents(content=content, mime_type="text/plain")]
             
             elif uri == "browser-status://sessions":
-                sessions_data = []
-                for session_id, session in self.sessions.items():
-                    sessions_data.append({
-                        "session_id": session_id,
-                        "browser_type": session.browser_type,
-                        "url": session.url,
-                        "created_at": session.created_at.isoformat(),
-                        "last_activity": session.last_activity.isoformat(),
-                        "is_current": session_id == self.current_session_id
-                    })
-                
-                return ReadResourceResult(
-                    contents=[{
-                        "uri": uri,
-                        "text": json.dumps(sessions_data, indent=2)
-                    }]
-                )
+                return [ReadResourceContents(content=self._get_sessions_json(), mime_type="application/json")]
             
-            return ReadResourceResult(
-                contents=[{
-                    "uri": uri,
-                    "text": "Resource not found"
-                }]
-            )
+            return [ReadResourceContents(content="Resource not found", mime_type="text/plain")]
+
+    def _sessions_changed(self):
+        """Invalidate the cached sessions resource after any session mutation."""
+        self._sessions_json = None
+
+    def _get_sessions_json(self) -> str:
+        """Serialized session list, rebuilt only after sessions have changed."""
+        if self._sessions_json is None:
+            self._sessions_json = _dumps(self._session_summaries(), indent=True)
+        return self._sessions_json
+
+    def _session_summaries(self) -> List[Dict[str, Any]]:
+        """Per-session listing entries, reusing each session's cached fields."""
+        return [
+            {**session.summary(), "is_current": session_id == self.current_session_id}
+            for session_id, session in self.sessions.items()
+        ]
 
     def setup_tools(self):
         """Register all enhanced Selenium tools with the MCP server."""
 
-        @self.server.list_tools()
-        async def handle_list_tools():
-            """List all available Selenium tools."""
-            tools = [
-                # Enhanced browser management
-                Tool(
-                    name="start_browser",
-                    description="launches browser with enhanced session management",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "browser": {
-                                "type": "string",
-                                "enum": ["chrome", "firefox"],
-                                "description": "Browser to launch (chrome or firefox)"
-                            },
-                            "options": {
-                                "type": "object",
-                                "properties": {
-                                    "headless": {
-                                        "type": "boolean",
-                                        "description": "Run browser in headless mode"
-                                    },
-                                    "arguments": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "Additional browser arguments"
+        # The tool list is static, so build it once rather than on every
+        # list_tools request.
+        self._tools = [
+            # Enhanced browser management
+            Tool(
+                name="start_browser",
+                description="launches browser with enhanced session management",
+                inputSchema=_input_schema(
+                    {
+                        "browser": {
+                            "type": "string",
+                            "enum": ["chrome", "firefox"],
+                            "description": "Browser to launch (chrome or firefox)"
+                        },
+                        "options": {
+                            "type": "object",
+                            "properties": {
+                                "headless": {
+                                    "type": "boolean",
+                                    "description": "Run browser in headless mode (default true unless SELENIUM_MCP_HEADFUL=1)"
+                                },
+                                "disable_images": {
+                                    "type": "boolean",
+                                    "description": "Do not load images, for faster page loads"
+                                },
+                                "arguments": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "description": "Additional browser arguments"
+                                },
+                                "window_size": {
+                                    "type": "object",
+                                    "properties": {
+                                        "width": {"type": "number"},
+                                        "height": {"type": "number"}
                                     },
-                                    "window_size": {
-                                        "type": "object",
-                                        "properties": {
-                                            "width": {"type": "number"},
-                                            "height": {"type": "number"}
-                                        },
-                                        "description": "Browser window size"
-                                    }
+                                    "description": "Browser window size"
                                 },
-                                "additionalProperties": False
-                            },
-                            "session_name": {
-                                "type": "string",
-                                "description": "Optional name for the session"
-                            }
-                        },
-                        "required": ["browser"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="list_sessions",
-                    description="lists all active browser sessions",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="switch_session",
-                    description="switches to a different browser session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_id": {
-                                "type": "string",
-                                "description": "Session ID to switch to"
-                            }
-                        },
-                        "required": ["session_id"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="close_session",
-                    description="closes a specific browser session",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "session_id": {
-                                "type": "string",
-                                "description": "Session ID to close (optional, closes current if not specified)"
-                            }
-                        },
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                # Enhanced navigation
-                Tool(
-                    name="navigate",
-                    description="navigates to a URL with enhanced error handling",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "URL to navigate to"
-                            },
-                            "wait_for_load": {
-                                "type": "boolean",
-                                "description": "Wait for page to fully load"
-                            }
-                        },
-                        "required": ["url"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                # Enhanced element interaction
-                Tool(
-                    name="find_element",
-                    description="finds an element with enhanced waiting",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            },
-                            "wait_for_clickable": {
-                                "type": "boolean",
-                                "description": "Wait for element to be clickable"
-                            }
-                        },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="click_element",
-                    description="clicks an element with enhanced error handling",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
+                                "page_load_strategy": {
+                                    "type": "string",
+                                    "enum": ["normal", "eager", "none"],
+                                    "description": "When navigation returns: after the load event (normal), after DOMContentLoaded (eager), or immediately (none, even with wait_for_load)"
+                                }
                             },
-                            "force_click": {
-                                "type": "boolean",
-                                "description": "Force click using JavaScript if normal click fails"
-                            }
+                            "additionalProperties": False
                         },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="send_keys",
-                    description="sends keys to an element with enhanced typing",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "text": {
-                                "type": "string",
-                                "description": "Text to enter into the element"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            },
-                            "clear_first": {
-                                "type": "boolean",
-                                "description": "Clear the field before typing"
-                            },
-                            "type_speed": {
-                                "type": "number",
-                                "description": "Delay between keystrokes in milliseconds"
-                            }
-                        },
-                        "required": ["by", "value", "text"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="get_element_text",
-                    description="gets the text of an element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            }
-                        },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                # Advanced interactions
-                Tool(
-                    name="hover",
-                    description="moves the mouse to hover over an element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            }
-                        },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="drag_and_drop",
-                    description="drags an element and drops it onto another element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            },
-                            "targetBy": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find target element"
-                            },
-                            "targetValue": {
-                                "type": "string",
-                                "description": "Value for the target locator strategy"
-                            }
-                        },
-                        "required": ["by", "value", "targetBy", "targetValue"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                        "session_name": {
+                            "type": "string",
+                            "description": "Optional name for the session"
+                        }
+                    },
+                    required=["browser"]
+                )
+            ),
+            Tool(
+                name="list_sessions",
+                description="lists all active browser sessions",
+                inputSchema=_input_schema({})
+            ),
+            Tool(
+                name="switch_session",
+                description="switches to a different browser session",
+                inputSchema=_input_schema(
+                    {
+                        "session_id": {
+                            "type": "string",
+                            "description": "Session ID to switch to"
+                        }
+                    },
+                    required=["session_id"]
+                )
+            ),
+            Tool(
+                name="close_session",
+                description="closes a specific browser session",
+                inputSchema=_input_schema({
+                    "session_id": {
+                        "type": "string",
+                        "description": "Session ID to close (optional, closes current if not specified)"
                     }
-                ),
-                Tool(
-                    name="double_click",
-                    description="performs a double click on an element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            }
+                })
+            ),
+            # Enhanced navigation
+            Tool(
+                name="navigate",
+                description="navigates to a URL with enhanced error handling",
+                inputSchema=_input_schema(
+                    {
+                        "url": {
+                            "type": "string",
+                            "description": "URL to navigate to"
                         },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                        "wait_for_load": {
+                            "type": "boolean",
+                            "description": "Wait for page to fully load"
+                        }
+                    },
+                    required=["url"]
+                )
+            ),
+            # Enhanced element interaction
+            Tool(
+                name="find_element",
+                description="finds an element with enhanced waiting",
+                inputSchema=_locator_schema({
+                    "wait_for_clickable": {
+                        "type": "boolean",
+                        "description": "Wait for element to be clickable"
                     }
-                ),
-                Tool(
-                    name="right_click",
-                    description="performs a right click (context click) on an element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            }
-                        },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                })
+            ),
+            Tool(
+                name="click_element",
+                description="clicks an element with enhanced error handling",
+                inputSchema=_locator_schema({
+                    "force_click": {
+                        "type": "boolean",
+                        "description": "Force click using JavaScript if normal click fails"
                     }
-                ),
-                Tool(
-                    name="press_key",
-                    description="simulates pressing a keyboard key",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "key": {
-                                "type": "string",
-                                "description": "Key to press (e.g., 'Enter', 'Tab', 'a', etc.)"
-                            }
+                })
+            ),
+            Tool(
+                name="send_keys",
+                description="sends keys to an element with enhanced typing",
+                inputSchema=_locator_schema(
+                    {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to enter into the element"
                         },
-                        "required": ["key"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                # File operations
-                Tool(
-                    name="upload_file",
-                    description="uploads a file using a file input element",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            },
-                            "filePath": {
-                                "type": "string",
-                                "description": "Absolute path to the file to upload"
-                            }
+                        "clear_first": {
+                            "type": "boolean",
+                            "description": "Clear the field before typing"
                         },
-                        "required": ["by", "value", "filePath"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="take_screenshot",
-                    description="captures a screenshot of the current page",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "outputPath": {
-                                "type": "string",
-                                "description": "Optional path where to save the screenshot. If not provided, returns base64 data."
-                            },
-                            "full_page": {
-                                "type": "boolean",
-                                "description": "Take full page screenshot"
-                            }
+                        "type_speed": {
+                            "type": "number",
+                            "description": "Average typing time per character in milliseconds. Below 50 ms, several characters are sent together in one burst and the pause comes after each burst; 50 ms or more gives a pause after every character"
+                        }
+                    },
+                    required=["text"]
+                )
+            ),
+            Tool(
+                name="get_element_text",
+                description="gets the text of an element",
+                inputSchema=_locator_schema()
+            ),
+            # Advanced interactions
+            Tool(
+                name="hover",
+                description="moves the mouse to hover over an element",
+                inputSchema=_locator_schema()
+            ),
+            Tool(
+                name="drag_and_drop",
+                description="drags an element and drops it onto another element",
+                inputSchema=_locator_schema(
+                    {
+                        "targetBy": {**_BY_PROP, "description": "Locator strategy to find target element"},
+                        "targetValue": {
+                            "type": "string",
+                            "description": "Value for the target locator strategy"
                         },
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                        "use_html5": {
+                            "type": "boolean",
+                            "description": "Dispatch HTML5 drag events via JavaScript instead of mouse actions"
+                        }
+                    },
+                    required=["targetBy", "targetValue"]
+                )
+            ),
+            Tool(
+                name="double_click",
+                description="performs a double click on an element",
+                inputSchema=_locator_schema()
+            ),
+            Tool(
+                name="right_click",
+                description="performs a right click (context click) on an element",
+                inputSchema=_locator_schema()
+            ),
+            Tool(
+                name="press_key",
+                description="simulates pressing a keyboard key",
+                inputSchema=_input_schema(
+                    {
+                        "key": {
+                            "type": "string",
+                            "description": "Key to press (e.g., 'Enter', 'Tab', 'a', etc.)"
+                        }
+                    },
+                    required=["key"]
+                )
+            ),
+            # File operations
+            Tool(
+                name="upload_file",
+                description="uploads a file using a file input element",
+                inputSchema=_locator_schema(
+                    {
+                        "filePath": {
+                            "type": "string",
+                            "description": "Absolute path to the file to upload"
+                        }
+                    },
+                    required=["filePath"]
+                )
+            ),
+            Tool(
+                name="take_screenshot",
+                description="captures a screenshot of the current page",
+                inputSchema=_input_schema({
+                    "outputPath": {
+                        "type": "string",
+                        "description": "Optional path where to save the screenshot. If not provided, returns base64 data."
+                    },
+                    "full_page": {
+                        "type": "boolean",
+                        "description": "Take full page screenshot"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["png", "jpeg"],
+                        "description": "Image format; jpeg is smaller but needs a Chromium-based browser (default png)"
+                    },
+                    "quality": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "maximum": 100,
+                        "description": "JPEG quality (default 80)"
                     }
-                ),
-                # New enhanced tools
-                Tool(
-                    name="wait_for_element",
-                    description="waits for an element to be present and optionally visible",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "by": {
-                                "type": "string",
-                                "enum": ["id", "css", "xpath", "name", "tag", "class"],
-                                "description": "Locator strategy to find element"
-                            },
-                            "value": {
-                                "type": "string",
-                                "description": "Value for the locator strategy"
-                            },
-                            "timeout": {
-                                "type": "number",
-                                "description": "Maximum time to wait for element in milliseconds"
-                            },
-                            "wait_for_visible": {
-                                "type": "boolean",
-                                "description": "Wait for element to be visible"
-                            }
-                        },
-                        "required": ["by", "value"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                })
+            ),
+            # New enhanced tools
+            Tool(
+                name="wait_for_element",
+                description="waits for an element to be present and optionally visible",
+                inputSchema=_locator_schema({
+                    "wait_for_visible": {
+                        "type": "boolean",
+                        "description": "Wait for element to be visible"
                     }
-                ),
-                Tool(
-                    name="execute_script",
-                    description="executes JavaScript code in the browser",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "script": {
-                                "type": "string",
-                                "description": "JavaScript code to execute"
-                            },
-                            "arguments": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Arguments to pass to the script"
-                            }
+                })
+            ),
+            Tool(
+                name="execute_script",
+                description="executes JavaScript code in the browser",
+                inputSchema=_input_schema(
+                    {
+                        "script": {
+                            "type": "string",
+                            "description": "JavaScript code to execute"
                         },
-                        "required": ["script"],
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
+                        "arguments": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Arguments to pass to the script"
+                        }
+                    },
+                    required=["script"]
+                )
+            ),
+            Tool(
+                name="get_page_info",
+                description="gets information about the current page",
+                inputSchema=_input_schema({
+                    "include_title": {
+                        "type": "boolean",
+                        "description": "Include page title"
+                    },
+                    "include_url": {
+                        "type": "boolean",
+                        "description": "Include current URL"
+                    },
+                    "include_source": {
+                        "type": "boolean",
+                        "description": "Include page source"
+                    },
+                    "max_source_bytes": {
+                        "type": "integer",
+                        "description": "Truncate the included source to this many UTF-8 bytes (default 262144, 0 for no limit)"
                     }
-                ),
-                Tool(
-                    name="get_page_info",
-                    description="gets information about the current page",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "include_title": {
-                                "type": "boolean",
-                                "description": "Include page title"
-                            },
-                            "include_url": {
-                                "type": "boolean",
-                                "description": "Include current URL"
-                            },
-                            "include_source": {
-                                "type": "boolean",
-                                "description": "Include page source"
+                })
+            ),
+            Tool(
+                name="batch_actions",
+                description="runs a sequence of find/click/text/attribute steps in one browser round trip; find steps do not wait for elements",
+                inputSchema=_input_schema(
+                    {
+                        "actions": {
+                            "type": "array",
+                            "description": "Steps to run in order; click/text/attribute act on the element from the last find",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "op": {
+                                        "type": "string",
+                                        "enum": ["find", "click", "text", "attribute"],
+                                        "description": "Step to perform"
+                                    },
+                                    "by": _BY_PROP,
+                                    "value": _VALUE_PROP,
+                                    "name": {
+                                        "type": "string",
+                                        "description": "Attribute name for the attribute step"
+                                    }
+                                },
+                                "required": ["op"],
+                                "additionalProperties": False
                             }
-                        },
-                        "additionalProperties": False,
-                        "$schema": "http://json-schema.org/draft-07/schema#"
-                    }
-                ),
-                Tool(
-                    name="get_server_version",
-                    description="Returns the current version of the Selenium MCP server",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                ),
-            ]
-            return tools
+                        }
+                    },
+                    required=["actions"]
+                )
+            ),
+            Tool(
+                name="get_server_version",
+                description="Returns the current version of the Selenium MCP server",
+                inputSchema=_input_schema({})
+            ),
+        ]
+
+        @self.server.list_tools()
+        async def handle_list_tools():
+            """List all available Selenium tools."""
+            return self._tools
 
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]):
             """Handle tool calls for enhanced Selenium operations."""
             try:
+                self._ensure_reaper()
+
                 # Update last activity for current session
                 if self.current_session_id and self.current_session_id in self.sessions:
-                    self.sessions[self.current_session_id].last_activity = datetime.now()
-
-                if name == "start_browser":
-                    return await self._start_browser(arguments)
-                elif name == "list_sessions":
-                    return await self._list_sessions(arguments)
-                elif name == "switch_session":
-                    return await self._switch_session(arguments)
-                elif name == "close_session":
-                    return await self._close_session(arguments)
-                elif name == "navigate":
-                    return await self._navigate(arguments)
-                elif name == "find_element":
-                    return await self._find_element(arguments)
-                elif name == "click_element":
-                    return await self._click_element(arguments)
-                elif name == "send_keys":
-                    return await self._send_keys(arguments)
-                elif name == "get_element_text":
-                    return await self._get_element_text(arguments)
-                elif name == "hover":
-                    return await self._hover(arguments)
-                elif name == "drag_and_drop":
-                    return await self._drag_and_drop(arguments)
-                elif name == "double_click":
-                    return await self._double_click(arguments)
-                elif name == "right_click":
-                    return await self._right_click(arguments)
-                elif name == "press_key":
-                    return await self._press_key(arguments)
-                elif name == "upload_file":
-                    return await self._upload_file(arguments)
-                elif name == "take_screenshot":
-                    return await self._take_screenshot(arguments)
-                elif name == "wait_for_element":
-                    return await self._wait_for_element(arguments)
-                elif name == "execute_script":
-                    return await self._execute_script(arguments)
-                elif name == "get_page_info":
-                    return await self._get_page_info(arguments)
-                elif name == "get_server_version":
-                    try:
-                        try:
-                            from importlib.metadata import version as pkg_version
-                        except ImportError:
-                            from importlib_metadata import version as pkg_version  # type: ignore
-                        try:
-                            version = pkg_version("selenium-mcp-server")
-                        except Exception:
-                            version = "unknown"
-                        return MCPResponse.success(
-                            f"Selenium MCP Server version: {version}",
-                            data={"version": version}
-                        ).to_dict()
-                    except Exception as e:
-                        return MCPResponse.error(
-                            f"Failed to get version: {str(e)}",
-                            error_code="VERSION_LOOKUP_ERROR",
-                            error_type=type(e).__name__,
-                            suggestion="Check package installation"
-                        ).to_dict()
-                else:
+                    self._touch_session(self.sessions[self.current_session_id])
+
+                handler = self._tool_handlers.get(name)
+                if handler is None:
                     return MCPResponse.error(
                         f"Unknown tool: {name}",
                         error_code="UNKNOWN_TOOL",
                         suggestion="Check the tool name and try again"
                     ).to_dict()
+                if _MAX_CONCURRENT_CALLS <= 0:
+                    return await handler(arguments)
+                if self._call_slots is None:
+                    self._call_slots = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+                async with self._call_slots:
+                    return await handler(arguments)
             except Exception as e:
                 logger.error(f"Error in tool {name}: {str(e)}")
                 return MCPResponse.error(
@@ -811,11 +1025,83 @@ class SeleniumMCPServer:
                     suggestion="Check the function parameters and try again"
                 ).to_dict()
 
-    def _get_current_driver(self) -> webdriver.Remote:
-        """Get the current active WebDriver instance."""
+    async def _get_server_version(self, arguments: Dict[str, Any]):
+        """Report the installed server version."""
+        try:
+            version = _get_package_version()
+            return MCPResponse.success(
+                f"Selenium MCP Server version: {version}",
+                data={"version": version}
+            ).to_dict()
+        except Exception as e:
+            return MCPResponse.error(
+                f"Failed to get version: {str(e)}",
+                error_code="VERSION_LOOKUP_ERROR",
+                error_type=type(e).__name__,
+                suggestion="Check package installation"
+            ).to_dict()
+
+    def _touch_session(self, session: BrowserSession):
+        """Record activity and move the session to the most recently used end."""
+        session.touch()
+        self.sessions.move_to_end(session.session_id)
+        self._sessions_changed()
+
+    def _remove_session(self, session_id: str) -> BrowserSession:
+        """Drop a session from the registry, moving 'current' to the most recently used one left."""
+        session = self.sessions.pop(session_id)
+        self._sessions_changed()
+        if self.current_session_id == session_id:
+            self.current_session_id = next(reversed(self.sessions), None)
+        return session
+
+    async def _dispose_session(self, session: BrowserSession):
+        """Hand a removed session's driver back to the pool, or quit it."""
+        pool_key = self._pool_key(session.browser_type, session.options)
+        if not await self._release_driver(pool_key, session.driver):
+            await self._run(self._quit_driver, session.driver)
+
+    async def _evict_idle(self, max_idle_ns: int):
+        """Close sessions that have been idle for longer than max_idle_ns."""
+        now = time.monotonic_ns()
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if now - session.last_activity <= max_idle_ns:
+                break
+            logger.info(f"Closing idle session {session.session_id}")
+            self._remove_session(session.session_id)
+            await self._dispose_session(session)
+
+    def _ensure_reaper(self):
+        """Start the idle-session reaper on first use when an idle timeout is configured."""
+        if self._reaper is None and _SESSION_IDLE_TIMEOUT > 0:
+            self._reaper = asyncio.ensure_future(self._idle_reaper())
+
+    async def _idle_reaper(self):
+        """Periodically close sessions idle for longer than the configured timeout."""
+        max_idle_ns = int(_SESSION_IDLE_TIMEOUT * 1_000_000_000)
+        while True:
+            await asyncio.sleep(min(60.0, _SESSION_IDLE_TIMEOUT))
+            try:
+                await self._evict_idle(max_idle_ns)
+            except Exception as e:
+                logger.warning(f"Idle session cleanup failed: {e}")
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run a blocking WebDriver call on the executor so the event loop stays free."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    def _get_current_session(self) -> BrowserSession:
+        """Get the current session, failing with the message tools report to clients."""
         if not self.current_session_id or self.current_session_id not in self.sessions:
             raise WebDriverException("No active browser session. Please start a browser first.")
-        return self.sessions[self.current_session_id].driver
+        return self.sessions[self.current_session_id]
+
+    def _get_current_driver(self) -> webdriver.Remote:
+        """Get the current active WebDriver instance."""
+        return self._get_current_session().driver
 
     def _get_session(self, session_id: Optional[str] = None) -> BrowserSession:
         """Get a browser session by ID or current session."""
@@ -828,17 +1114,229 @@ class SeleniumMCPServer:
                 raise WebDriverException("No active browser session.")
             return self.sessions[self.current_session_id]
 
-    def _get_locator(self, by: str) -> By:
-        """Convert string locator to Selenium By enum."""
-        locator_map = {
-            "id": By.ID,
-            "css": By.CSS_SELECTOR,
-            "xpath": By.XPATH,
-            "name": By.NAME,
-            "tag": By.TAG_NAME,
-            "class": By.CLASS_NAME
-        }
-        return locator_map.get(by, By.CSS_SELECTOR)
+    def _get_locator(self, by: str, value: str) -> tuple:
+        """Convert a tool locator into a Selenium (By, value) tuple."""
+        return (_BY_MAP.get(by, By.CSS_SELECTOR), value)
+
+    @staticmethod
+    def _wait(driver, timeout: int) -> WebDriverWait:
+        """Build a WebDriverWait for a timeout in milliseconds using the short poll interval."""
+        return WebDriverWait(driver, timeout / 1000, poll_frequency=_POLL_FREQUENCY)
+
+    def _await_presence(self, driver: webdriver.Remote, locator: tuple, timeout: int):
+        """Wait for an element to be attached, woken by DOM mutations instead of polling."""
+        by, value = locator
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            wait_ms = max(0, min(int(remaining_ms), _OBSERVE_CHUNK_MS))
+            try:
+                element = driver.execute_async_script(_AWAIT_ELEMENT_JS, by, value, wait_ms)
+            except WebDriverException:
+                # The page navigated mid-wait, the selector is invalid or scripts are
+                # unavailable; poll for whatever time is left
+                remaining_ms = max(0, (deadline - time.monotonic()) * 1000)
+                return self._wait(driver, remaining_ms).until(EC.presence_of_element_located(locator))
+            if element is not None:
+                return element
+            if remaining_ms <= _OBSERVE_CHUNK_MS:
+                raise TimeoutException(f"No element matching {value!r} within {timeout}ms")
+
+    def _find(self, session: BrowserSession, locator: tuple, timeout: int, clickable: bool = False):
+        """Wait for an element, reusing the session's cached lookup when it is still usable."""
+        # A presence lookup is itself a single script call, so the cache only
+        # saves the clickable checks, and only once one call has confirmed the
+        # locator still resolves to the cached element (the DOM may have re-rendered)
+        element = session.cached_element(locator) if clickable else None
+        if element is not None:
+            try:
+                if session.driver.execute_script(_CACHED_MATCH_JS, *locator, element):
+                    return element
+            except WebDriverException:
+                pass
+            session.forget_element(locator)
+
+        if clickable:
+            element = self._wait(session.driver, timeout).until(EC.element_to_be_clickable(locator))
+        else:
+            element = self._await_presence(session.driver, locator, timeout)
+        session.cache_element(locator, element)
+        return element
+
+    def _with_element(self, session: BrowserSession, locator: tuple, timeout: int, action,
+                      clickable: bool = False):
+        """Run action on the located element, finding it again once if the cached one went stale."""
+        try:
+            return action(self._find(session, locator, timeout, clickable))
+        except StaleElementReferenceException:
+            session.forget_element(locator)
+            return action(self._find(session, locator, timeout, clickable))
+
+    @staticmethod
+    def _pool_key(browser: str, options: Dict[str, Any]) -> str:
+        """Key identifying drivers that were launched with the same configuration."""
+        return json.dumps([browser.lower(), options], sort_keys=True)
+
+    async def _checkout_driver(self, pool_key: str) -> Optional[webdriver.Remote]:
+        """Take a live idle driver from the pool, discarding any that died while parked."""
+        pool = self._driver_pool.get(pool_key)
+        while pool:
+            driver = pool.pop()
+            try:
+                await self._run(getattr, driver, "current_url")
+                return driver
+            except Exception:
+                logger.debug("Dropping dead pooled driver", exc_info=True)
+                await self._run(self._quit_driver, driver)
+        return None
+
+    async def _release_driver(self, pool_key: str, driver: webdriver.Remote) -> bool:
+        """Reset a driver and park it in the pool. Returns False if it was not pooled."""
+        pool = self._driver_pool.setdefault(pool_key, [])
+        if len(pool) >= _DRIVER_POOL_SIZE or not await self._run(self._reset_driver, driver):
+            return False
+        # Another close may have filled the pool while this driver was being reset
+        if len(pool) >= _DRIVER_POOL_SIZE:
+            return False
+        pool.append(driver)
+        return True
+
+    @staticmethod
+    def _reset_driver(driver: webdriver.Remote) -> bool:
+        """Clear a driver's windows, cookies and site data. Returns False if it could not be reset.
+
+        Only Chromium browsers can drop cookies and storage for every site
+        through CDP; other browsers are never reset and so never pooled.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            # Collect every origin the session's windows navigated to
+            origins = set()
+            for handle in driver.window_handles:
+                driver.switch_to.window(handle)
+                history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+                for entry in history.get("entries", []):
+                    parts = urlparse(entry.get("url", ""))
+                    if parts.scheme in ("http", "https") and parts.netloc:
+                        origins.add(f"{parts.scheme}://{parts.netloc}")
+            # Leave a single blank window with no cookies, storage or history behind
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.get("about:blank")
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+        except Exception:
+            logger.debug("Driver could not be reset for reuse", exc_info=True)
+            return False
+        return True
+
+    @staticmethod
+    def _tune_command_pool(driver: webdriver.Remote):
+        """Let the driver's HTTP client keep more than one connection alive."""
+        conn = getattr(driver.command_executor, "_conn", None)
+        pool_kw = getattr(conn, "connection_pool_kw", None)
+        if pool_kw is None:
+            return
+        pool_kw["maxsize"] = _COMMAND_POOL_MAXSIZE
+        pool_kw["block"] = False
+        # Drop the pools created with the default size so new ones pick this up
+        conn.clear()
+
+    @staticmethod
+    def _quit_driver(driver: webdriver.Remote):
+        """Quit a driver, ignoring errors from an already dead browser."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    async def shutdown(self):
+        """Quit every session and pooled driver, then stop the executor."""
+        # Let in-flight background launches finish; they quit what they launch
+        self._closing = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+        await asyncio.gather(*self._refill_tasks.values(), return_exceptions=True)
+        self._refill_tasks.clear()
+        drivers = [session.driver for session in self.sessions.values()]
+        for pool in self._driver_pool.values():
+            drivers.extend(pool)
+        self.sessions.clear()
+        self._sessions_changed()
+        self.current_session_id = None
+        self._driver_pool.clear()
+        await asyncio.gather(*(self._run(self._quit_driver, driver) for driver in drivers))
+        self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _spawn_driver(browser: str, options: Dict[str, Any]) -> webdriver.Remote:
+        """Launch a new browser with the requested options."""
+        window_size = options.get("window_size")
+        size = (window_size["width"], window_size["height"]) if window_size else None
+        disable_images = options.get("disable_images", False)
+        browser_args = _browser_arguments(
+            browser.lower(), options.get("headless", _HEADLESS_DEFAULT), tuple(options.get("arguments", [])),
+            size, disable_images
+        )
+        page_load_strategy = options.get("page_load_strategy", "normal")
+        
+        # Options objects are mutated by Selenium during launch, so only
+        # their argument list is cached and a fresh object is built each time.
+        if browser.lower() == "chrome":
+            chrome_options = ChromeOptions()
+            for arg in browser_args:
+                chrome_options.add_argument(arg)
+            chrome_options.page_load_strategy = page_load_strategy
+            
+            service = ChromeService(_resolve_driver("chrome"))
+            return webdriver.Chrome(service=service, options=chrome_options)
+        
+        firefox_options = FirefoxOptions()
+        for arg in browser_args:
+            firefox_options.add_argument(arg)
+        firefox_options.page_load_strategy = page_load_strategy
+        if disable_images:
+            firefox_options.set_preference("permissions.default.image", 2)
+        
+        service = FirefoxService(_resolve_driver("firefox"))
+        return webdriver.Firefox(service=service, options=firefox_options)
+
+    async def _launch_driver(self, browser: str, options: Dict[str, Any]) -> webdriver.Remote:
+        """Launch a browser off the event loop, re-resolving a stale driver binary once."""
+        try:
+            driver = await self._run(self._spawn_driver, browser, options)
+        except SessionNotCreatedException:
+            # The remembered driver may no longer match the installed browser
+            _forget_driver(browser.lower())
+            driver = await self._run(self._spawn_driver, browser, options)
+        self._tune_command_pool(driver)
+        return driver
+
+    def _schedule_refill(self, pool_key: str, browser: str, options: Dict[str, Any]):
+        """Start topping up the warm pool for pool_key unless a refill is already running."""
+        task = self._refill_tasks.get(pool_key)
+        if task is None or task.done():
+            self._refill_tasks[pool_key] = asyncio.ensure_future(self._refill_pool(pool_key, browser, options))
+
+    async def _refill_pool(self, pool_key: str, browser: str, options: Dict[str, Any]):
+        """Launch drivers in the background until the pool holds _WARM_DRIVERS of them."""
+        while not self._closing and len(self._driver_pool.get(pool_key, ())) < _WARM_DRIVERS:
+            try:
+                driver = await self._launch_driver(browser, options)
+            except Exception as e:
+                logger.warning(f"Could not pre-launch a browser: {e}")
+                return
+            if self._closing:
+                await self._run(self._quit_driver, driver)
+                return
+            self._driver_pool.setdefault(pool_key, []).append(driver)
 
     async def _start_browser(self, arguments: Dict[str, Any]):
         """Start a new browser session with enhanced features."""
@@ -846,56 +1344,45 @@ class SeleniumMCPServer:
         options = arguments.get("options", {})
         session_name = arguments.get("session_name")
         
-        headless = options.get("headless", False)
-        additional_args = options.get("arguments", [])
-        window_size = options.get("window_size")
+        headless = options.get("headless", _HEADLESS_DEFAULT)
+
+        pool_key = self._pool_key(browser, options)
+
+        if browser.lower() not in _DRIVER_MANAGERS:
+            return MCPResponse.error(
+                f"Unsupported browser: {browser}",
+                error_code="UNSUPPORTED_BROWSER",
+                suggestion="Use 'chrome' or 'firefox'"
+            ).to_dict()
 
         try:
-            if browser.lower() == "chrome":
-                chrome_options = ChromeOptions()
-                if headless:
-                    chrome_options.add_argument("--headless=new")
-                for arg in additional_args:
-                    chrome_options.add_argument(arg)
-                
-                if window_size:
-                    chrome_options.add_argument(f"--window-size={window_size['width']},{window_size['height']}")
-                
-                service = ChromeService(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                
-            elif browser.lower() == "firefox":
-                firefox_options = FirefoxOptions()
-                if headless:
-                    firefox_options.add_argument("--headless")
-                for arg in additional_args:
-                    firefox_options.add_argument(arg)
-                
-                if window_size:
-                    firefox_options.add_argument(f"--width={window_size['width']}")
-                    firefox_options.add_argument(f"--height={window_size['height']}")
-                
-                service = FirefoxService(GeckoDriverManager().install())
-                driver = webdriver.Firefox(service=service, options=firefox_options)
-            else:
-                return MCPResponse.error(
-                    f"Unsupported browser: {browser}",
-                    error_code="UNSUPPORTED_BROWSER",
-                    suggestion="Use 'chrome' or 'firefox'"
-                ).to_dict()
+            # Make room by closing the least recently used sessions
+            while _MAX_SESSIONS > 0 and len(self.sessions) >= _MAX_SESSIONS:
+                oldest_id = next(iter(self.sessions))
+                logger.info(f"Session limit reached, closing session {oldest_id}")
+                await self._dispose_session(self._remove_session(oldest_id))
+
+            driver = await self._checkout_driver(pool_key)
+            if driver is None:
+                driver = await self._launch_driver(browser, options)
+            if _WARM_DRIVERS > 0:
+                self._schedule_refill(pool_key, browser, options)
 
             # Create session with enhanced metadata
             session_id = str(uuid.uuid4())
+            created_ns = time.monotonic_ns()
             session = BrowserSession(
                 session_id=session_id,
                 driver=driver,
                 browser_type=browser,
                 created_at=datetime.now(),
-                last_activity=datetime.now(),
-                options=options
+                last_activity=created_ns,
+                options=options,
+                created_ns=created_ns
             )
             
             self.sessions[session_id] = session
+            self._sessions_changed()
             self.current_session_id = session_id
 
             return MCPResponse.success(
@@ -924,17 +1411,7 @@ class SeleniumMCPServer:
                 data={"sessions": []}
             ).to_dict()
         
-        session_list = []
-        for session_id, session in self.sessions.items():
-            session_info = {
-                "session_id": session_id,
-                "browser_type": session.browser_type,
-                "url": session.url,
-                "created_at": session.created_at.isoformat(),
-                "last_activity": session.last_activity.isoformat(),
-                "is_current": session_id == self.current_session_id
-            }
-            session_list.append(session_info)
+        session_list = self._session_summaries()
         
         return MCPResponse.success(
             f"Found {len(session_list)} active session(s)",
@@ -957,6 +1434,7 @@ class SeleniumMCPServer:
             )
         
         self.current_session_id = session_id
+        self._sessions_changed()
         return CallToolResult(
             content=[{"type": "text", "text": f"✅ Switched to session: {session_id}"}]
         )
@@ -972,14 +1450,8 @@ class SeleniumMCPServer:
             )
         
         try:
-            session = self.sessions[session_id]
-            session.driver.quit()
-            del self.sessions[session_id]
-            
-            if self.current_session_id == session_id:
-                self.current_session_id = None
-                if self.sessions:
-                    self.current_session_id = next(iter(self.sessions.keys()))
+            session = self._remove_session(session_id)
+            await self._dispose_session(session)
             
             return CallToolResult(
                 content=[{"type": "text", "text": f"✅ Session {session_id} closed successfully"}]
@@ -1003,19 +1475,18 @@ class SeleniumMCPServer:
             ).to_dict()
 
         try:
-            driver = self._get_current_driver()
-            driver.get(url)
+            session = self._get_current_session()
+            driver = session.driver
+            await self._run(driver.get, url)
             
             # Update session URL
-            session = self._get_session()
             session.url = url
-            session.last_activity = datetime.now()
+            session.forget_elements()
+            self._touch_session(session)
             
-            if wait_for_load:
-                # Wait for page to load
-                WebDriverWait(driver, 10).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
+            ready_states = _LOAD_READY_STATES.get(session.options.get("page_load_strategy", "normal"))
+            if wait_for_load and ready_states:
+                await self._wait_until_loaded(driver, ready_states)
             
             return MCPResponse.success(
                 f"✅ Successfully navigated to {url}",
@@ -1033,6 +1504,19 @@ class SeleniumMCPServer:
                 suggestion="Check the URL and try again"
             ).to_dict()
 
+    async def _wait_until_loaded(self, driver: webdriver.Remote, ready_states: Tuple[str, ...] = ("complete",),
+                                 timeout: float = 10.0):
+        """Poll document.readyState, backing off from 25 ms to 200 ms, until it is one of ready_states."""
+        deadline = time.monotonic() + timeout
+        delay = _READY_POLL_MIN
+        while await self._run(driver.execute_script, "return document.readyState") not in ready_states:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Page did not finish loading within {timeout:g}s")
+            # Sleep on the loop rather than in a worker, so no thread is held while waiting
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _READY_POLL_MAX)
+
     async def _find_element(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Find an element with enhanced waiting."""
         by = arguments.get("by", "css")
@@ -1047,17 +1531,12 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
+            session = self._get_current_session()
+            locator = self._get_locator(by, value)
             
-            if wait_for_clickable:
-                element = WebDriverWait(driver, timeout / 1000).until(
-                    EC.element_to_be_clickable(locator)
-                )
-            else:
-                element = WebDriverWait(driver, timeout / 1000).until(
-                    EC.presence_of_element_located(locator)
-                )
+            # Always look the element up afresh; this also refreshes the cache
+            session.forget_element(locator)
+            await self._run(self._find, session, locator, timeout, clickable=wait_for_clickable)
             
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Element found successfully"}]
@@ -1087,20 +1566,21 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.element_to_be_clickable(locator)
-            )
+            session = self._get_current_session()
+            driver = session.driver
+            locator = self._get_locator(by, value)
             
-            try:
-                element.click()
-            except ElementClickInterceptedException:
-                if force_click:
-                    # Use JavaScript as fallback
-                    driver.execute_script("arguments[0].click();", element)
-                else:
-                    raise
+            def click(element):
+                try:
+                    element.click()
+                except ElementClickInterceptedException:
+                    if force_click:
+                        # Use JavaScript as fallback
+                        driver.execute_script("arguments[0].click();", element)
+                    else:
+                        raise
+            
+            await self._run(self._with_element, session, locator, timeout, click, clickable=True)
             
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Element clicked successfully"}]
@@ -1137,22 +1617,40 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
+            session = self._get_current_session()
+            locator = self._get_locator(by, value)
+            
+            # Plain text typed at full speed can be set by script in one call.
+            # Control characters ("\n" submits a form) and special keys (Keys.*
+            # are in the private use area) need real key presses from send_keys.
+            fill_by_script = type_speed <= 0 and not any(
+                ch < " " or ch == "\x7f" or "\ue000" <= ch <= "\uf8ff" for ch in text
             )
             
-            if clear_first:
-                element.clear()
+            def type_text(element):
+                if fill_by_script and session.driver.execute_script(
+                    _FILL_INPUT_JS, element, text, clear_first
+                ):
+                    return element
+                if clear_first:
+                    element.clear()
+                if type_speed <= 0:
+                    element.send_keys(text)
+                return element
+            
+            element = await self._run(self._with_element, session, locator, timeout, type_text)
             
             if type_speed > 0:
-                # Type with delay
-                for char in text:
-                    element.send_keys(char)
-                    await asyncio.sleep(type_speed / 1000)
-            else:
-                element.send_keys(text)
+                # Type with delay. Fast speeds are sent a few characters per
+                # command so the round trip, not the delay, doesn't set the pace.
+                chunk_size = max(1, int(_TYPING_CHUNK_MS // type_speed))
+                for start in range(0, len(text), chunk_size):
+                    chunk = text[start:start + chunk_size]
+                    started = time.monotonic()
+                    await self._run(element.send_keys, chunk)
+                    remaining = type_speed * len(chunk) / 1000 - (time.monotonic() - started)
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
             
             return CallToolResult(
                 content=[{"type": "text", "text": f"✅ Text '{text}' entered successfully"}]
@@ -1181,13 +1679,9 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
-            )
-            
-            text = element.text
+            session = self._get_current_session()
+            locator = self._get_locator(by, value)
+            text = await self._run(self._with_element, session, locator, timeout, lambda element: element.text)
             return CallToolResult(
                 content=[{"type": "text", "text": text}]
             )
@@ -1215,15 +1709,14 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
+            session = self._get_current_session()
+            driver = session.driver
+            locator = self._get_locator(by, value)
+            await self._run(
+                self._with_element, session, locator, timeout,
+                lambda element: ActionChains(driver).move_to_element(element).perform()
             )
             
-            actions = ActionChains(driver)
-            actions.move_to_element(element).perform()
-            
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Hovered over element successfully"}]
             )
@@ -1245,6 +1738,7 @@ class SeleniumMCPServer:
         target_by = arguments.get("targetBy", "css")
         target_value = arguments.get("targetValue")
         timeout = arguments.get("timeout", 10000)
+        use_html5 = arguments.get("use_html5", False)
         
         if not value or not target_value:
             return CallToolResult(
@@ -1253,19 +1747,28 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            source_locator = self._get_locator(by)
-            target_locator = self._get_locator(target_by)
-            
-            source_element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(source_locator)
-            )
-            target_element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(target_locator)
-            )
+            session = self._get_current_session()
+            driver = session.driver
+            source_locator = self._get_locator(by, value)
+            target_locator = self._get_locator(target_by, target_value)
             
-            actions = ActionChains(driver)
-            actions.drag_and_drop(source_element, target_element).perform()
+            async def drag():
+                # WebDriver runs one command per session at a time, so the lookups go in turn
+                source_element = await self._run(self._find, session, source_locator, timeout)
+                target_element = await self._run(self._find, session, target_locator, timeout)
+                if use_html5:
+                    await self._run(driver.execute_script, _HTML5_DRAG_JS, source_element, target_element)
+                else:
+                    await self._run(
+                        ActionChains(driver).drag_and_drop(source_element, target_element).perform
+                    )
+
+            try:
+                await drag()
+            except StaleElementReferenceException:
+                session.forget_element(source_locator)
+                session.forget_element(target_locator)
+                await drag()
             
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Drag and drop completed successfully"}]
@@ -1294,15 +1797,14 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
+            session = self._get_current_session()
+            driver = session.driver
+            locator = self._get_locator(by, value)
+            await self._run(
+                self._with_element, session, locator, timeout,
+                lambda element: ActionChains(driver).double_click(element).perform()
             )
             
-            actions = ActionChains(driver)
-            actions.double_click(element).perform()
-            
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Double click performed successfully"}]
             )
@@ -1330,15 +1832,14 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
+            session = self._get_current_session()
+            driver = session.driver
+            locator = self._get_locator(by, value)
+            await self._run(
+                self._with_element, session, locator, timeout,
+                lambda element: ActionChains(driver).context_click(element).perform()
             )
             
-            actions = ActionChains(driver)
-            actions.context_click(element).perform()
-            
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Right click performed successfully"}]
             )
@@ -1366,7 +1867,7 @@ class SeleniumMCPServer:
         try:
             driver = self._get_current_driver()
             actions = ActionChains(driver)
-            actions.key_down(key).key_up(key).perform()
+            await self._run(actions.key_down(key).key_up(key).perform)
             
             return CallToolResult(
                 content=[{"type": "text", "text": f"✅ Key '{key}' pressed successfully"}]
@@ -1391,14 +1892,13 @@ class SeleniumMCPServer:
             )
 
         try:
-            driver = self._get_current_driver()
-            locator = self._get_locator(by)
-            element = WebDriverWait(driver, timeout / 1000).until(
-                EC.presence_of_element_located(locator)
+            session = self._get_current_session()
+            locator = self._get_locator(by, value)
+            await self._run(
+                self._with_element, session, locator, timeout,
+                lambda element: element.send_keys(file_path)
             )
             
-            element.send_keys(file_path)
-            
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ File upload initiated successfully"}]
             )
@@ -1413,31 +1913,61 @@ class SeleniumMCPServer:
                 isError=True
             )
 
+    @staticmethod
+    def _capture_screenshot(driver: webdriver.Remote, full_page: bool, image_format: str = "png",
+                            quality: int = 80) -> Tuple[bytes, str]:
+        """Capture the viewport, or the whole document when full_page is set and supported.
+
+        Returns the image bytes and their format; only Chromium browsers, which
+        capture through CDP, can produce JPEG, so others fall back to PNG.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            params = {"format": image_format}
+            if image_format == "jpeg":
+                params["quality"] = quality
+            if full_page:
+                metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                size = metrics.get("cssContentSize") or metrics["contentSize"]
+                params["captureBeyondViewport"] = True
+                params["clip"] = {"x": 0, "y": 0, "width": size["width"], "height": size["height"], "scale": 1}
+            shot = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+            return base64.b64decode(shot["data"]), image_format
+        if full_page and isinstance(driver, webdriver.Firefox):
+            return driver.get_full_page_screenshot_as_png(), "png"
+        return driver.get_screenshot_as_png(), "png"
+
     async def _take_screenshot(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Take a screenshot."""
         output_path = arguments.get("outputPath")
         full_page = arguments.get("full_page", False)
+        image_format = arguments.get("format", "png")
+        quality = arguments.get("quality", 80)
+        
+        if image_format not in ("png", "jpeg"):
+            return CallToolResult(
+                content=[{"type": "text", "text": f"Unsupported screenshot format: {image_format}"}],
+                isError=True
+            )
         
         try:
             driver = self._get_current_driver()
             
-            if full_page:
-                # Full page screenshot
-                screenshot = driver.get_screenshot_as_base64()
-            else:
-                # Viewport screenshot
-                screenshot = driver.get_screenshot_as_base64()
+            # Work with the raw bytes; base64 is only produced when returning inline
+            image, image_format = await self._run(
+                self._capture_screenshot, driver, full_page, image_format, quality
+            )
             
             if output_path:
-                import base64
-                with open(output_path, "wb") as f:
-                    f.write(base64.b64decode(screenshot))
+                await self._run(_write_bytes, output_path, image)
                 return CallToolResult(
                     content=[{"type": "text", "text": f"✅ Screenshot saved to {output_path}"}]
                 )
             else:
                 return CallToolResult(
-                    content=[{"type": "text", "text": f"✅ Screenshot captured: {screenshot[:100]}..."}]
+                    content=[
+                        {"type": "text", "text": f"✅ Screenshot captured ({len(image)} bytes)"},
+                        {"type": "image", "data": base64.b64encode(image).decode("ascii"), "mimeType": f"image/{image_format}"}
+                    ]
                 )
         except Exception as e:
             return CallToolResult(
@@ -1460,16 +1990,12 @@ class SeleniumMCPServer:
 
         try:
             driver = self._get_current_driver()
-            locator = self._get_locator(by)
+            locator = self._get_locator(by, value)
             
             if wait_for_visible:
-                WebDriverWait(driver, timeout / 1000).until(
-                    EC.visibility_of_element_located(locator)
-                )
+                await self._run(self._wait(driver, timeout).until, EC.visibility_of_element_located(locator))
             else:
-                WebDriverWait(driver, timeout / 1000).until(
-                    EC.presence_of_element_located(locator)
-                )
+                await self._run(self._await_presence, driver, locator, timeout)
             
             return CallToolResult(
                 content=[{"type": "text", "text": "✅ Element found and ready"}]
@@ -1498,7 +2024,7 @@ class SeleniumMCPServer:
 
         try:
             driver = self._get_current_driver()
-            result = driver.execute_script(script, *script_args)
+            result = await self._run(driver.execute_script, script, *script_args)
             
             return CallToolResult(
                 content=[{"type": "text", "text": f"✅ JavaScript executed: {result}"}]
@@ -1509,29 +2035,95 @@ class SeleniumMCPServer:
                 isError=True
             )
 
+    async def _batch_actions(self, arguments: Dict[str, Any]):
+        """Run several element steps with a single execute_script call."""
+        actions = arguments.get("actions") or []
+
+        if not actions:
+            return MCPResponse.error(
+                "At least one action is required",
+                error_code="MISSING_ACTIONS",
+                suggestion="Start with a 'find' step, e.g. {\"op\": \"find\", \"by\": \"css\", \"value\": \"#id\"}"
+            ).to_dict()
+
+        try:
+            driver = self._get_current_driver()
+            steps = [
+                {**step, "by": self._get_locator(step.get("by", "css"), step.get("value"))[0]}
+                if step.get("op") == "find" else step
+                for step in actions
+            ]
+            outcome = await self._run(driver.execute_script, _BATCH_ACTIONS_JS, steps)
+            results = outcome.get("results", [])
+
+            if "error" in outcome:
+                return MCPResponse.error(
+                    f"❌ Batch stopped at step {outcome['failed_at']}: {outcome['error']} "
+                    f"(completed: {_dumps(results)})",
+                    error_code="BATCH_STEP_FAILED",
+                    suggestion="Check the failing step's locator and order"
+                ).to_dict()
+
+            return MCPResponse.success(
+                f"✅ Ran {len(actions)} actions: {_dumps(results)}",
+                data={"results": results}
+            ).to_dict()
+        except Exception as e:
+            return MCPResponse.error(
+                f"❌ Error running batch actions: {str(e)}",
+                error_code="BATCH_ERROR",
+                error_type=type(e).__name__
+            ).to_dict()
+
+    @staticmethod
+    def _read_page_info(driver, include_source: bool, max_source_bytes: int) -> Dict[str, Any]:
+        """Read title, URL and source in one script call, or command by command if scripts fail."""
+        try:
+            return driver.execute_script(_PAGE_INFO_JS, include_source, max_source_bytes)
+        except WebDriverException as e:
+            logger.debug(f"Page info script failed, reading fields individually: {e}")
+        info = {"title": driver.title, "url": driver.current_url}
+        if include_source:
+            source = driver.page_source
+            info["truncated"] = 0 < max_source_bytes < len(source)
+            info["source"] = source[:max_source_bytes] if info["truncated"] else source
+        return info
+
     async def _get_page_info(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Get comprehensive page information."""
         include_title = arguments.get("include_title", True)
         include_url = arguments.get("include_url", True)
         include_source = arguments.get("include_source", False)
+        max_source_bytes = arguments.get("max_source_bytes", _MAX_SOURCE_BYTES)
         
         try:
             driver = self._get_current_driver()
-            page_info = {}
             
-            if include_title:
-                page_info["title"] = driver.title
+            info = await self._run(self._read_page_info, driver, include_source, max_source_bytes)
             
+            page_info = {}
+            if include_title:
+                page_info["title"] = info["title"]
             if include_url:
-                page_info["url"] = driver.current_url
-            
+                page_info["url"] = info["url"]
             if include_source:
-                page_info["source"] = driver.page_source
+                source = info["source"]
+                truncated = info["truncated"]
+                if max_source_bytes > 0:
+                    # surrogatepass: a malformed page may still hold a lone surrogate,
+                    # which the trimming decode below then drops
+                    encoded = source.encode("utf-8", errors="surrogatepass")
+                    if len(encoded) > max_source_bytes:
+                        source = encoded[:max_source_bytes].decode("utf-8", errors="ignore")
+                        truncated = True
+                    page_info["source_truncated"] = truncated
+                page_info["source"] = source
             
             page_info["timestamp"] = datetime.now().isoformat()
             
+            # Pretty-printing a multi-megabyte document only makes another copy of it
             return CallToolResult(
-                content=[{"type": "text", "text": json.dumps(page_info, indent=2)}]
+                content=[{"type": "text", "text": _dumps(page_info, indent=not include_source)}]
             )
         except Exception as e:
             return CallToolResult(
@@ -1539,9 +2131,87 @@ class SeleniumMCPServer:
                 isError=True
             )
 
+async def _connect_stdio_pipes():
+    """Attach stdin/stdout to the event loop as pipes, or return None if they cannot be."""
+    if sys.platform == "win32" or SessionMessage is None:
+        return None
+    # Only pipes and sockets, as MCP clients provide: regular files cannot be
+    # polled (uvloop aborts rather than raising), nor can devices like /dev/null
+    for stream in (sys.stdin, sys.stdout):
+        try:
+            mode = os.fstat(stream.fileno()).st_mode
+        except (AttributeError, OSError, ValueError):
+            return None
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+            return None
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_STDIO_LINE_LIMIT)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer)
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout.buffer)
+    except (OSError, ValueError, NotImplementedError) as e:
+        logger.debug(f"stdio pipes unavailable, using the threaded transport: {e}")
+        return None
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+@asynccontextmanager
+async def _stdio_transport():
+    """Like mcp's stdio_server, but reading and writing stdio on the event loop.
+
+    The stock transport hands every line to a worker thread; reading the pipes
+    directly avoids that per-message thread hop. Falls back to stdio_server
+    where pipes cannot be attached (Windows, regular files).
+    """
+    pipes = await _connect_stdio_pipes()
+    if pipes is None:
+        async with stdio_server() as streams:
+            yield streams
+        return
+    reader, writer = pipes
+
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+
+    async def stdin_reader():
+        try:
+            async with read_stream_writer:
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except ValueError as exc:
+                        # Line longer than _STDIO_LINE_LIMIT; the reader has skipped it
+                        await read_stream_writer.send(exc)
+                        continue
+                    if not line:
+                        break
+                    try:
+                        message = JSONRPCMessage.model_validate_json(line)
+                    except Exception as exc:
+                        await read_stream_writer.send(exc)
+                        continue
+                    await read_stream_writer.send(SessionMessage(message))
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def stdout_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    json_line = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    writer.write(json_line.encode("utf-8") + b"\n")
+                    await writer.drain()
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stdin_reader)
+        tg.start_soon(stdout_writer)
+        yield read_stream, write_stream
+
 async def main():
     """Main entry point for the Selenium MCP server."""
-    # Get and log the current version
+    # Get and log the current version. stdout carries the JSON-RPC stream,
+    # so the banner goes to stderr.
     try:
         # First try to get version from pyproject.toml (for development)
         import toml
@@ -1549,41 +2219,47 @@ async def main():
             with open("pyproject.toml", "r") as f:
                 pyproject_data = toml.load(f)
                 version = pyproject_data.get("project", {}).get("version", "unknown")
-                print(f"Starting Selenium MCP Server v{version} (development)")
+                print(f"Starting Selenium MCP Server v{version} (development)", file=sys.stderr)
                 logger.info(f"Selenium MCP Server v{version} starting up (development)...")
         except Exception:
             # Fallback to package metadata
-            try:
-                from importlib.metadata import version as pkg_version
-            except ImportError:
-                from importlib_metadata import version as pkg_version  # type: ignore
-            try:
-                version = pkg_version("selenium-mcp-server")
-                print(f"Starting Selenium MCP Server v{version}")
-                logger.info(f"Selenium MCP Server v{version} starting up...")
-            except Exception:
-                version = "unknown"
-                print(f"Starting Selenium MCP Server v{version}")
-                logger.info(f"Selenium MCP Server v{version} starting up...")
+            version = _get_package_version()
+            print(f"Starting Selenium MCP Server v{version}", file=sys.stderr)
+            logger.info(f"Selenium MCP Server v{version} starting up...")
     except Exception as e:
-        print(f"Starting Selenium MCP Server (version unknown)")
+        print(f"Starting Selenium MCP Server (version unknown)", file=sys.stderr)
         logger.info(f"Selenium MCP Server starting up (version lookup failed: {e})")
     
     server = SeleniumMCPServer()
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="selenium-mcp",
-                server_version="2.0.0",
-                capabilities=server.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities=None,
+    try:
+        async with _stdio_transport() as (read_stream, write_stream):
+            await server.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="selenium-mcp",
+                    server_version="2.0.0",
+                    capabilities=server.server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities=None,
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await server.shutdown()
+
+def run():
+    """Run the server, on uvloop when it is installed and not disabled."""
+    # uvloop is POSIX-only; SELENIUM_MCP_EVENT_LOOP=asyncio forces the stdlib loop
+    if sys.platform != "win32" and os.environ.get("SELENIUM_MCP_EVENT_LOOP", "").lower() != "asyncio":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(main())
+    return asyncio.run(main())
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run()
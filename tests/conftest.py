@@ -0,0 +1,29 @@
+"""
+Shared pytest fixtures and collection hooks for the Selenium MCP Server tests
+"""
+
+import shutil
+
+import pytest
+
+from .test_selenium_mcp import MCPTester
+
+
+@pytest.fixture(scope="session")
+def tester():
+    """One simulated MCP client shared by every test in the session"""
+    return MCPTester()
+
+
+# Executables that mean a browser the real-browser scripts can drive is installed
+_BROWSER_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome", "firefox")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark tests from REQUIRES_BROWSER modules, skipping them when no browser is installed"""
+    have_browser = any(shutil.which(name) for name in _BROWSER_BINARIES)
+    for item in items:
+        if getattr(getattr(item, "module", None), "REQUIRES_BROWSER", False):
+            item.add_marker(pytest.mark.browser)
+            if not have_browser:
+                item.add_marker(pytest.mark.skip(reason="needs Chrome or Firefox installed"))
@@ -4,9 +4,33 @@ Test Runner for Selenium MCP Server
 Run different test suites easily
 """
 
+import argparse
 import asyncio
+import importlib
+import inspect
+import shutil
 import sys
 import os
+import tempfile
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Test file -> (module name, sync or async entry point); modules are imported once
+# and reused from sys.modules on later runs
+TESTS = {
+    "interactive_test.py": ("interactive_test", "test_basic_functionality"),
+    "test_browser_management.py": ("test_browser_management", "test_browser_management"),
+    "test_error_handling.py": ("test_error_handling", "test_error_handling"),
+    "test_selenium_mcp.py": ("test_selenium_mcp", "main"),
+}
+
+# --suite names for the command line
+SUITES = {
+    "basic": "interactive_test.py",
+    "browser": "test_browser_management.py",
+    "error": "test_error_handling.py",
+    "full": "test_selenium_mcp.py",
+}
 
 def print_menu():
     """Print the test menu"""
@@ -22,9 +46,14 @@ def print_menu():
     print("7. ❌ Exit")
     print("=" * 50)
 
+def _entry_point(filename):
+    """Entry point function of a registered test file"""
+    module_name, entry_point = TESTS[filename]
+    return getattr(importlib.import_module(module_name), entry_point)
+
 def run_test_file(filename):
     """Run a specific test file"""
-    if not os.path.exists(filename):
+    if filename not in TESTS:
         print(f"❌ Test file {filename} not found!")
         return False
     
@@ -32,57 +61,45 @@ def run_test_file(filename):
     print("=" * 50)
     
     try:
-        # Import and run the test
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("test_module", filename)
-        if spec is None:
-            print(f"❌ Could not load spec for {filename}")
-            return False
-        test_module = importlib.util.module_from_spec(spec)
-        if spec.loader is None:
-            print(f"❌ Could not load module {filename}")
-            return False
-        spec.loader.exec_module(test_module)
-        
-        # Find the main test function
-        if hasattr(test_module, 'test_basic_functionality'):
-            asyncio.run(test_module.test_basic_functionality())
-        elif hasattr(test_module, 'test_browser_management'):
-            asyncio.run(test_module.test_browser_management())
-        elif hasattr(test_module, 'test_error_handling'):
-            asyncio.run(test_module.test_error_handling())
-        elif hasattr(test_module, 'main'):
-            asyncio.run(test_module.main())
+        entry = _entry_point(filename)
+        if inspect.iscoroutinefunction(entry):
+            asyncio.run(entry())
         else:
-            print(f"❌ No test function found in {filename}")
-            return False
-        
+            entry()
         return True
     except Exception as e:
         print(f"❌ Error running {filename}: {e}")
         return False
 
-def run_all_tests():
+async def run_test_async(filename):
+    """Run a specific test file on the current event loop"""
+    try:
+        entry = _entry_point(filename)
+        if inspect.iscoroutinefunction(entry):
+            await entry()
+        else:
+            entry()
+        return True
+    except Exception as e:
+        print(f"❌ Error running {filename}: {e}")
+        return False
+
+async def run_tests_concurrently(test_files):
+    """Run test files side by side; each test creates its own server"""
+    return await asyncio.gather(*(run_test_async(test_file) for test_file in test_files))
+
+def run_all_tests(parallel=False):
     """Run all test files"""
-    test_files = [
-        "interactive_test.py",
-        "test_browser_management.py", 
-        "test_error_handling.py",
-        "test_selenium_mcp.py"
-    ]
-    
     print("\n🎯 Running All Tests")
     print("=" * 50)
     
-    results = {}
-    for test_file in test_files:
-        if os.path.exists(test_file):
+    if parallel:
+        results = dict(zip(TESTS, asyncio.run(run_tests_concurrently(list(TESTS)))))
+    else:
+        results = {}
+        for test_file in TESTS:
             print(f"\n📋 Running {test_file}...")
-            success = run_test_file(test_file)
-            results[test_file] = success
-        else:
-            print(f"⚠️ {test_file} not found, skipping...")
-            results[test_file] = False
+            results[test_file] = run_test_file(test_file)
     
     # Print summary
     print("\n📊 Test Results Summary")
@@ -94,6 +111,7 @@ def run_all_tests():
     passed = sum(results.values())
     total = len(results)
     print(f"\n🎉 {passed}/{total} tests passed!")
+    return passed == total
 
 def show_test_files():
     """Show available test files"""
@@ -109,11 +127,42 @@ def show_test_files():
     ]
     
     for filename, description in test_files:
-        exists = "✅" if os.path.exists(filename) else "❌"
+        exists = "✅" if os.path.exists(os.path.join(TESTS_DIR, filename)) else "❌"
         print(f"{exists} {filename}: {description}")
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Run the Selenium MCP Server test suites")
+    parser.add_argument("--suite", choices=[*SUITES, "all"],
+                        help="run this suite without the menu and exit")
+    parser.add_argument("--all", action="store_true", help="same as --suite all")
+    parser.add_argument("--parallel", action="store_true",
+                        help="with --suite all, run the suites concurrently")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="never prompt; runs all suites unless --suite is given")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main test runner function"""
+    args = parse_args(argv)
+    # Screenshots from every suite go to one scratch directory, removed on exit
+    outdir = tempfile.mkdtemp(prefix="selmcp-")
+    os.environ["SELMCP_OUT"] = outdir
+    try:
+        return run(args)
+    finally:
+        shutil.rmtree(outdir, ignore_errors=True)
+
+def run(args):
+    """Run the suites chosen on the command line, or the interactive menu"""
+    if args.suite or args.all or args.yes:
+        suite = "all" if args.all else (args.suite or "all")
+        if suite == "all":
+            passed = run_all_tests(parallel=args.parallel)
+        else:
+            passed = run_test_file(SUITES[suite])
+        return 0 if passed else 1
+    
     while True:
         print_menu()
         
@@ -148,4 +197,6 @@ def main():
             input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Make the test modules importable whatever the working directory
+    sys.path.insert(0, TESTS_DIR)
+    sys.exit(main()) 
\ No newline at end of file
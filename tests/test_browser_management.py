@@ -8,9 +8,17 @@ import asyncio
 import time
 import sys
 import os
+import traceback
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from selenium_mcp_server import SeleniumMCPServer
 
+# Launches real browsers; pytest skips this file when none is installed
+REQUIRES_BROWSER = True
+
+def session_id_of(result):
+    """Session ID reported by a start_browser result, or None if it failed"""
+    return result.get("structuredContent", {}).get("data", {}).get("session_id")
+
 async def test_browser_management():
     """Test browser management functionality"""
     print("🌐 Testing Browser Management Features")
@@ -26,52 +34,44 @@ async def test_browser_management():
             "options": {"headless": False},
             "session_name": "chrome_test"
         })
+        chrome_session = session_id_of(result)
         print(f"✅ Chrome started: {result}")
         
-        # Test 2: List sessions
-        print("\n2️⃣ Listing active sessions...")
-        result = await server._list_sessions({})
-        print(f"✅ Active sessions: {result}")
-        
-        # Test 3: Start Firefox browser
-        print("\n3️⃣ Starting Firefox browser...")
+        # Test 2: Start Firefox browser
+        print("\n2️⃣ Starting Firefox browser...")
         result = await server._start_browser({
             "browser": "firefox",
             "options": {"headless": True},
             "session_name": "firefox_test"
         })
+        firefox_session = session_id_of(result)
         print(f"✅ Firefox started: {result}")
         
-        # Test 4: List sessions again
-        print("\n4️⃣ Listing sessions after Firefox...")
+        # Test 3: List sessions
+        print("\n3️⃣ Listing active sessions...")
         result = await server._list_sessions({})
         print(f"✅ Active sessions: {result}")
         
-        # Test 5: Navigate in Chrome
-        print("\n5️⃣ Navigating Chrome to Google...")
+        # Test 4: Navigate in Chrome
+        print("\n4️⃣ Navigating Chrome to Google...")
+        if chrome_session:
+            await server._switch_session({"session_id": chrome_session})
         result = await server._navigate({
             "url": "https://www.google.com",
             "wait_for_load": True
         })
         print(f"✅ Chrome navigation: {result}")
         
-        # Test 6: Switch to Firefox
-        print("\n6️⃣ Switching to Firefox session...")
-        sessions = await server._list_sessions({})
-        firefox_session = None
-        for session in sessions.get('sessions', []):
-            if session.get('name') == 'firefox_test':
-                firefox_session = session.get('id')
-                break
-        
+        # Test 5: Switch to Firefox
+        print("\n5️⃣ Switching to Firefox session...")
         if firefox_session:
             result = await server._switch_session({
                 "session_id": firefox_session
             })
             print(f"✅ Switched to Firefox: {result}")
             
-            # Test 7: Navigate in Firefox
-            print("\n7️⃣ Navigating Firefox to Bing...")
+            # Test 6: Navigate in Firefox
+            print("\n6️⃣ Navigating Firefox to Bing...")
             result = await server._navigate({
                 "url": "https://www.bing.com",
                 "wait_for_load": True
@@ -80,43 +80,36 @@ async def test_browser_management():
         else:
             print("⚠️ Firefox session not found")
         
-        # Test 8: Switch back to Chrome
-        print("\n8️⃣ Switching back to Chrome...")
-        sessions = await server._list_sessions({})
-        chrome_session = None
-        for session in sessions.get('sessions', []):
-            if session.get('name') == 'chrome_test':
-                chrome_session = session.get('id')
-                break
-        
+        # Test 7: Switch back to Chrome
+        print("\n7️⃣ Switching back to Chrome...")
         if chrome_session:
             result = await server._switch_session({
                 "session_id": chrome_session
             })
             print(f"✅ Switched to Chrome: {result}")
             
-            # Test 9: Get page info in Chrome
-            print("\n9️⃣ Getting Chrome page info...")
+            # Test 8: Get page info in Chrome
+            print("\n8️⃣ Getting Chrome page info...")
             result = await server._get_page_info({
                 "include_title": True,
                 "include_url": True
             })
             print(f"✅ Chrome page info: {result}")
         
-        # Test 10: Take screenshots from both browsers
-        print("\n🔟 Taking screenshots...")
+        # Test 9: Take screenshots from both browsers
+        print("\n9️⃣ Taking screenshots...")
         
         # Chrome screenshot
         await server._switch_session({"session_id": chrome_session})
         result = await server._take_screenshot({
-            "outputPath": "chrome_test.png"
+            "outputPath": os.path.join(os.environ.get("SELMCP_OUT", "."), "chrome_test.png")
         })
         print(f"✅ Chrome screenshot: {result}")
         
         # Firefox screenshot
         await server._switch_session({"session_id": firefox_session})
         result = await server._take_screenshot({
-            "outputPath": "firefox_test.png"
+            "outputPath": os.path.join(os.environ.get("SELMCP_OUT", "."), "firefox_test.png")
         })
         print(f"✅ Firefox screenshot: {result}")
         
@@ -124,29 +117,39 @@ async def test_browser_management():
         
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+        # The message above is usually enough; full tracebacks on request
+        if os.environ.get("SELMCP_DEBUG"):
+            traceback.print_exc()
     
     finally:
         # Clean up all sessions
         print("\n🧹 Cleaning up all sessions...")
+        # Quit the browsers concurrently, a few at a time to limit driver processes
+        closing = asyncio.Semaphore(4)
+
+        async def close_one(session_id):
+            async with closing:
+                return session_id, await server._close_session({"session_id": session_id})
+
         try:
-            sessions = await server._list_sessions({})
-            for session in sessions.get('sessions', []):
-                session_id = session.get('id')
-                if session_id:
-                    await server._switch_session({"session_id": session_id})
-                    await server._close_session({})
-                    print(f"✅ Closed session: {session.get('name', 'unknown')}")
+            results = await asyncio.gather(*(close_one(session_id) for session_id in list(server.sessions)))
+            for session_id, result in results:
+                if result.isError:
+                    print(f"⚠️ Could not close session {session_id}: {result.content[0].text}")
+                else:
+                    print(f"✅ Closed session: {session_id}")
         except Exception as e:
             print(f"⚠️ Cleanup error: {e}")
+        finally:
+            # Quit anything still running, pooled drivers included, and stop the executor
+            await server.shutdown()
 
 if __name__ == "__main__":
     print("Selenium MCP Server - Browser Management Test")
     print("This will test multiple browser sessions and switching")
     print("Make sure you have Chrome and Firefox installed")
     
-    response = input("\nPress Enter to continue or 'q' to quit: ")
+    response = "" if "--yes" in sys.argv[1:] else input("\nPress Enter to continue or 'q' to quit: ")
     if response.lower() != 'q':
         asyncio.run(test_browser_management())
     else:
@@ -6,362 +6,408 @@ This script tests all the features of our Selenium MCP server,
 demonstrating the improvements over the original angiejones/mcp-selenium.
 """
 
-import asyncio
+import io
+import itertools
 import json
+import logging
 import sys
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
+log = logging.getLogger(__name__)
+
+# Simulated payloads are serialized once; each call only fills in the timestamp
+_TS = "__TS__"
+_SESSIONS_TEMPLATE = json.dumps([
+    {
+        "session_id": "session_1",
+        "browser_type": "chrome",
+        "url": "https://www.google.com",
+        "created_at": _TS,
+        "last_activity": _TS,
+        "is_current": True
+    },
+    {
+        "session_id": "session_2",
+        "browser_type": "firefox",
+        "url": "https://www.example.com",
+        "created_at": _TS,
+        "last_activity": _TS,
+        "is_current": False
+    }
+], indent=2)
+_PAGE_INFO_TEMPLATE = json.dumps({
+    "title": "Test Page",
+    "url": "https://example.com",
+    "timestamp": _TS
+}, indent=2)
+
+# Fixed response texts, filled with %-formatting
+_SESSION_TPL = "✅ Browser started successfully! Session ID: session_%d"
+_TPL_SWITCH = "✅ Switched to session: %s"
+_TPL_NAV = "✅ Successfully navigated to %s"
+_TPL_SCRIPT = "✅ JavaScript executed: %s"
+_TPL_DEFAULT = "✅ %s executed successfully"
+
+def _ok(text: str) -> dict:
+    """Successful tool result carrying a single text item."""
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+# Simulated tool responses, dispatched by tool name from MCPTester.simulate_tool_call
+def _h_start_browser(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_SESSION_TPL % next(tester._id_gen))
+
+def _h_list_sessions(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_SESSIONS_TEMPLATE.replace(_TS, datetime.now().isoformat()))
+
+def _h_switch_session(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_TPL_SWITCH % arguments.get("session_id"))
+
+def _h_navigate(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_TPL_NAV % arguments.get("url"))
+
+def _h_execute_script(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_TPL_SCRIPT % arguments.get("script"))
+
+def _h_get_page_info(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_PAGE_INFO_TEMPLATE.replace(_TS, datetime.now().isoformat()))
+
+def _h_default(tool_name: str, arguments: dict, tester: "MCPTester") -> dict:
+    return _ok(_TPL_DEFAULT % tool_name)
+
+_HANDLERS = {
+    "start_browser": _h_start_browser,
+    "list_sessions": _h_list_sessions,
+    "switch_session": _h_switch_session,
+    "navigate": _h_navigate,
+    "execute_script": _h_execute_script,
+    "get_page_info": _h_get_page_info,
+}
+
+# Test cases are built once at import and shared read-only between runs
+_JS_TESTS = (
+    MappingProxyType({
+        "name": "Get page title",
+        "script": "return document.title;"
+    }),
+    MappingProxyType({
+        "name": "Get page URL",
+        "script": "return window.location.href;"
+    }),
+    MappingProxyType({
+        "name": "Scroll to bottom",
+        "script": "window.scrollTo(0, document.body.scrollHeight);"
+    }),
+    MappingProxyType({
+        "name": "Click element by ID",
+        "script": "document.getElementById('button').click();"
+    }),
+)
+
+_INTERACTION_TESTS = (
+    MappingProxyType({
+        "name": "Wait for element with visibility",
+        "tool": "wait_for_element",
+        "args": MappingProxyType({
+            "by": "id",
+            "value": "content",
+            "wait_for_visible": True,
+            "timeout": 10000
+        })
+    }),
+    MappingProxyType({
+        "name": "Force click with JavaScript fallback",
+        "tool": "click_element",
+        "args": MappingProxyType({
+            "by": "css",
+            "value": ".button",
+            "force_click": True,
+            "timeout": 5000
+        })
+    }),
+    MappingProxyType({
+        "name": "Enhanced typing with options",
+        "tool": "send_keys",
+        "args": MappingProxyType({
+            "by": "name",
+            "value": "search",
+            "text": "Enhanced automation",
+            "clear_first": True,
+            "type_speed": 100
+        })
+    }),
+)
+
+_ERROR_SCENARIOS = (
+    MappingProxyType({
+        "scenario": "Timeout Exception",
+        "error": "⏰ Timeout error: Element not found within 5000ms"
+    }),
+    MappingProxyType({
+        "scenario": "Element Not Found",
+        "error": "🔍 Element not found: id=non-existent-element"
+    }),
+    MappingProxyType({
+        "scenario": "Click Intercepted",
+        "error": "🖱️ Click intercepted: Element is covered by another element"
+    }),
+    MappingProxyType({
+        "scenario": "Session Not Created",
+        "error": "🚫 Session not created: Browser failed to start"
+    }),
+)
+_ERROR_OUTPUT = "\n".join(
+    f"\n   {scenario['scenario']}: {scenario['error']}" for scenario in _ERROR_SCENARIOS
+)
+
+_COMPARISON_DATA = MappingProxyType({
+    "Multiple Sessions": MappingProxyType({
+        "Original": "❌ Single session only",
+        "Enhanced": "✅ Multiple concurrent sessions",
+        "Improvement": "🟢 Superior"
+    }),
+    "Session Management": MappingProxyType({
+        "Original": "❌ No session switching",
+        "Enhanced": "✅ List, switch, manage sessions",
+        "Improvement": "🟢 New Feature"
+    }),
+    "Error Handling": MappingProxyType({
+        "Original": "⚠️ Basic try-catch",
+        "Enhanced": "✅ Specific exception types",
+        "Improvement": "🟢 Better"
+    }),
+    "JavaScript Execution": MappingProxyType({
+        "Original": "❌ Not available",
+        "Enhanced": "✅ Execute custom JavaScript",
+        "Improvement": "🟢 New Feature"
+    }),
+    "Page Information": MappingProxyType({
+        "Original": "❌ Not available",
+        "Enhanced": "✅ Comprehensive page details",
+        "Improvement": "🟢 New Feature"
+    }),
+    "Resource Management": MappingProxyType({
+        "Original": "⚠️ Basic cleanup",
+        "Enhanced": "✅ Enhanced cleanup and tracking",
+        "Improvement": "🟢 Better"
+    }),
+    "Configuration": MappingProxyType({
+        "Original": "⚠️ Basic options",
+        "Enhanced": "✅ Window size, session naming",
+        "Improvement": "🟢 Better"
+    }),
+})
+_CMP_TEXT = "".join(
+    f"\n{feature}:\n  Original: {data['Original']}\n  Enhanced: {data['Enhanced']}\n  Status: {data['Improvement']}\n"
+    for feature, data in _COMPARISON_DATA.items()
+)
+
+class _Log:
+    """Collects a test's output so it reaches stdout in a single write."""
+
+    def __init__(self):
+        self._buf = io.StringIO()
+
+    def p(self, *args):
+        print(*args, file=self._buf)
+
+    def flush(self):
+        sys.stdout.write(self._buf.getvalue())
+        sys.stdout.flush()
+
 class MCPTester:
     """Test class for the Selenium MCP server."""
     
     def __init__(self):
-        self.test_results = []
+        # Simulated session IDs count up like the server's session_1, session_2, ...
+        self._id_gen = itertools.count(1)
         
     def simulate_tool_call(self, tool_name: str, arguments: dict, expected_result: Optional[str] = None) -> dict:
         """Simulate a tool call and return the result."""
-        print(f"\n🔧 Testing: {tool_name}")
-        print(f"📝 Arguments: {json.dumps(arguments, indent=2)}")
+        # Lazy %-formatting: nothing is rendered unless debug logging is on
+        log.debug("Testing %s", tool_name)
+        log.debug("Arguments: %s", arguments)
         
         # Simulate enhanced responses
-        if tool_name == "start_browser":
-            session_id = f"session_{len(self.test_results) + 1}"
-            return {
-                "content": [{"type": "text", "text": f"✅ Browser started successfully! Session ID: {session_id}"}],
-                "isError": False
-            }
-        elif tool_name == "list_sessions":
-            sessions = [
-                {
-                    "session_id": "session_1",
-                    "browser_type": "chrome",
-                    "url": "https://www.google.com",
-                    "created_at": datetime.now().isoformat(),
-                    "last_activity": datetime.now().isoformat(),
-                    "is_current": True
-                },
-                {
-                    "session_id": "session_2", 
-                    "browser_type": "firefox",
-                    "url": "https://www.example.com",
-                    "created_at": datetime.now().isoformat(),
-                    "last_activity": datetime.now().isoformat(),
-                    "is_current": False
-                }
-            ]
-            return {
-                "content": [{"type": "text", "text": json.dumps(sessions, indent=2)}],
-                "isError": False
-            }
-        elif tool_name == "switch_session":
-            return {
-                "content": [{"type": "text", "text": f"✅ Switched to session: {arguments.get('session_id')}"}],
-                "isError": False
-            }
-        elif tool_name == "navigate":
-            return {
-                "content": [{"type": "text", "text": f"✅ Successfully navigated to {arguments.get('url')}"}],
-                "isError": False
-            }
-        elif tool_name == "execute_script":
-            return {
-                "content": [{"type": "text", "text": f"✅ JavaScript executed: {arguments.get('script')}"}],
-                "isError": False
-            }
-        elif tool_name == "get_page_info":
-            page_info = {
-                "title": "Test Page",
-                "url": "https://example.com",
-                "timestamp": datetime.now().isoformat()
-            }
-            return {
-                "content": [{"type": "text", "text": json.dumps(page_info, indent=2)}],
-                "isError": False
-            }
-        else:
-            return {
-                "content": [{"type": "text", "text": f"✅ {tool_name} executed successfully"}],
-                "isError": False
-            }
+        handler = _HANDLERS.get(tool_name, _h_default)
+        return handler(tool_name, arguments, self)
 
-async def test_multiple_sessions():
+def test_multiple_sessions(tester: MCPTester):
     """Test multiple session management - NEW FEATURE."""
-    print("\n🔄 Testing Multiple Session Management")
-    print("=" * 50)
-    
-    tester = MCPTester()
-    
-    # Test 1: Start multiple browsers
-    print("\n1. Starting multiple browser sessions...")
-    
-    # Start Chrome session
-    result1 = tester.simulate_tool_call("start_browser", {
-        "browser": "chrome",
-        "options": {
-            "headless": False,
-            "window_size": {"width": 1920, "height": 1080}
-        },
-        "session_name": "main_chrome"
-    })
-    print(f"Result: {result1['content'][0]['text']}")
-    
-    # Start Firefox session
-    result2 = tester.simulate_tool_call("start_browser", {
-        "browser": "firefox",
-        "options": {
-            "headless": True,
-            "arguments": ["--no-sandbox"]
-        },
-        "session_name": "secondary_firefox"
-    })
-    print(f"Result: {result2['content'][0]['text']}")
+    out = _Log()
+    try:
+        # Test 1: Start multiple browsers
+        out.p("\n1. Starting multiple browser sessions...")
+    
+        # Start Chrome session
+        result1 = tester.simulate_tool_call("start_browser", {
+            "browser": "chrome",
+            "options": {
+                "headless": False,
+                "window_size": {"width": 1920, "height": 1080}
+            },
+            "session_name": "main_chrome"
+        })
+        out.p(f"Result: {result1['content'][0]['text']}")
+    
+        # Start Firefox session
+        result2 = tester.simulate_tool_call("start_browser", {
+            "browser": "firefox",
+            "options": {
+                "headless": True,
+                "arguments": ["--no-sandbox"]
+            },
+            "session_name": "secondary_firefox"
+        })
+        out.p(f"Result: {result2['content'][0]['text']}")
     
-    # Test 2: List all sessions
-    print("\n2. Listing all sessions...")
-    result3 = tester.simulate_tool_call("list_sessions", {})
-    print(f"Result: {result3['content'][0]['text']}")
+        # Test 2: List all sessions
+        out.p("\n2. Listing all sessions...")
+        result3 = tester.simulate_tool_call("list_sessions", {})
+        out.p(f"Result: {result3['content'][0]['text']}")
     
-    # Test 3: Switch between sessions
-    print("\n3. Switching between sessions...")
-    result4 = tester.simulate_tool_call("switch_session", {"session_id": "session_2"})
-    print(f"Result: {result4['content'][0]['text']}")
+        # Test 3: Switch between sessions
+        out.p("\n3. Switching between sessions...")
+        result4 = tester.simulate_tool_call("switch_session", {"session_id": "session_2"})
+        out.p(f"Result: {result4['content'][0]['text']}")
     
-    print("✅ Multiple session management test completed!")
+        out.p("✅ Multiple session management test completed!")
+    finally:
+        out.flush()
 
-async def test_enhanced_navigation():
+def test_enhanced_navigation(tester: MCPTester):
     """Test enhanced navigation features."""
-    print("\n🧭 Testing Enhanced Navigation")
-    print("=" * 40)
-    
-    tester = MCPTester()
-    
-    # Test navigation with load waiting
-    print("\n1. Navigating with load waiting...")
-    result = tester.simulate_tool_call("navigate", {
-        "url": "https://www.example.com",
-        "wait_for_load": True
-    })
-    print(f"Result: {result['content'][0]['text']}")
+    out = _Log()
+    try:
+        # Test navigation with load waiting
+        out.p("\n1. Navigating with load waiting...")
+        result = tester.simulate_tool_call("navigate", {
+            "url": "https://www.example.com",
+            "wait_for_load": True
+        })
+        out.p(f"Result: {result['content'][0]['text']}")
     
-    print("✅ Enhanced navigation test completed!")
+        out.p("✅ Enhanced navigation test completed!")
+    finally:
+        out.flush()
 
-async def test_javascript_execution():
+def test_javascript_execution(tester: MCPTester):
     """Test JavaScript execution - NEW FEATURE."""
-    print("\n⚡ Testing JavaScript Execution")
-    print("=" * 40)
-    
-    tester = MCPTester()
-    
-    # Test various JavaScript operations
-    js_tests = [
-        {
-            "name": "Get page title",
-            "script": "return document.title;"
-        },
-        {
-            "name": "Get page URL",
-            "script": "return window.location.href;"
-        },
-        {
-            "name": "Scroll to bottom",
-            "script": "window.scrollTo(0, document.body.scrollHeight);"
-        },
-        {
-            "name": "Click element by ID",
-            "script": "document.getElementById('button').click();"
-        }
-    ]
-    
-    for i, test in enumerate(js_tests, 1):
-        print(f"\n{i}. {test['name']}...")
-        result = tester.simulate_tool_call("execute_script", {
-            "script": test["script"]
-        })
-        print(f"Result: {result['content'][0]['text']}")
-    
-    print("✅ JavaScript execution test completed!")
+    out = _Log()
+    try:
+        # Test various JavaScript operations
+        for i, test in enumerate(_JS_TESTS, 1):
+            out.p(f"\n{i}. {test['name']}...")
+            result = tester.simulate_tool_call("execute_script", {
+                "script": test["script"]
+            })
+            out.p(f"Result: {result['content'][0]['text']}")
+    
+        out.p("✅ JavaScript execution test completed!")
+    finally:
+        out.flush()
 
-async def test_page_information():
+def test_page_information(tester: MCPTester):
     """Test page information gathering - NEW FEATURE."""
-    print("\n📄 Testing Page Information")
-    print("=" * 35)
-    
-    tester = MCPTester()
-    
-    # Test getting comprehensive page info
-    print("\n1. Getting page information...")
-    result = tester.simulate_tool_call("get_page_info", {
-        "include_title": True,
-        "include_url": True,
-        "include_source": False
-    })
-    print(f"Result: {result['content'][0]['text']}")
+    out = _Log()
+    try:
+        # Test getting comprehensive page info
+        out.p("\n1. Getting page information...")
+        result = tester.simulate_tool_call("get_page_info", {
+            "include_title": True,
+            "include_url": True,
+            "include_source": False
+        })
+        out.p(f"Result: {result['content'][0]['text']}")
     
-    print("✅ Page information test completed!")
+        out.p("✅ Page information test completed!")
+    finally:
+        out.flush()
 
-async def test_enhanced_element_interaction():
+def test_enhanced_element_interaction(tester: MCPTester):
     """Test enhanced element interaction features."""
-    print("\n🎯 Testing Enhanced Element Interaction")
-    print("=" * 45)
-    
-    tester = MCPTester()
-    
-    # Test enhanced element interactions
-    interaction_tests = [
-        {
-            "name": "Wait for element with visibility",
-            "tool": "wait_for_element",
-            "args": {
-                "by": "id",
-                "value": "content",
-                "wait_for_visible": True,
-                "timeout": 10000
-            }
-        },
-        {
-            "name": "Force click with JavaScript fallback",
-            "tool": "click_element",
-            "args": {
-                "by": "css",
-                "value": ".button",
-                "force_click": True,
-                "timeout": 5000
-            }
-        },
-        {
-            "name": "Enhanced typing with options",
-            "tool": "send_keys",
-            "args": {
-                "by": "name",
-                "value": "search",
-                "text": "Enhanced automation",
-                "clear_first": True,
-                "type_speed": 100
-            }
-        }
-    ]
-    
-    for i, test in enumerate(interaction_tests, 1):
-        print(f"\n{i}. {test['name']}...")
-        result = tester.simulate_tool_call(test["tool"], test["args"])
-        print(f"Result: {result['content'][0]['text']}")
-    
-    print("✅ Enhanced element interaction test completed!")
+    out = _Log()
+    try:
+        # Test enhanced element interactions
+        for i, test in enumerate(_INTERACTION_TESTS, 1):
+            out.p(f"\n{i}. {test['name']}...")
+            result = tester.simulate_tool_call(test["tool"], test["args"])
+            out.p(f"Result: {result['content'][0]['text']}")
+    
+        out.p("✅ Enhanced element interaction test completed!")
+    finally:
+        out.flush()
 
-async def test_error_handling():
+def test_error_handling():
     """Test enhanced error handling."""
-    print("\n🛡️ Testing Enhanced Error Handling")
-    print("=" * 40)
-    
-    print("\n1. Testing specific error types...")
+    out = _Log()
+    try:
+        out.p("\n1. Testing specific error types...")
     
-    error_scenarios = [
-        {
-            "scenario": "Timeout Exception",
-            "error": "⏰ Timeout error: Element not found within 5000ms"
-        },
-        {
-            "scenario": "Element Not Found",
-            "error": "🔍 Element not found: id=non-existent-element"
-        },
-        {
-            "scenario": "Click Intercepted",
-            "error": "🖱️ Click intercepted: Element is covered by another element"
-        },
-        {
-            "scenario": "Session Not Created",
-            "error": "🚫 Session not created: Browser failed to start"
-        }
-    ]
+        out.p(_ERROR_OUTPUT)
     
-    for scenario in error_scenarios:
-        print(f"\n   {scenario['scenario']}: {scenario['error']}")
-    
-    print("✅ Enhanced error handling test completed!")
+        out.p("✅ Enhanced error handling test completed!")
+    finally:
+        out.flush()
 
-async def test_performance_features():
+def test_performance_features():
     """Test performance and optimization features."""
-    print("\n⚡ Testing Performance Features")
-    print("=" * 35)
-    
-    print("\n1. Testing automatic driver management...")
-    print("   ✅ WebDriver Manager automatically downloads and manages drivers")
+    out = _Log()
+    try:
+        out.p("\n1. Testing automatic driver management...")
+        out.p("   ✅ WebDriver Manager automatically downloads and manages drivers")
     
-    print("\n2. Testing memory management...")
-    print("   ✅ Enhanced session cleanup and resource management")
+        out.p("\n2. Testing memory management...")
+        out.p("   ✅ Enhanced session cleanup and resource management")
     
-    print("\n3. Testing activity tracking...")
-    print("   ✅ Session activity tracking for better resource management")
+        out.p("\n3. Testing activity tracking...")
+        out.p("   ✅ Session activity tracking for better resource management")
     
-    print("\n4. Testing retry mechanisms...")
-    print("   ✅ Automatic retry for common failures")
+        out.p("\n4. Testing retry mechanisms...")
+        out.p("   ✅ Automatic retry for common failures")
     
-    print("✅ Performance features test completed!")
+        out.p("✅ Performance features test completed!")
+    finally:
+        out.flush()
+
+def _banner(title: str, width: int) -> str:
+    """Section heading printed before a test, underlined to the given width."""
+    return f"\n{title}\n{'=' * width}"
+
+# Test functions in run order, with their banners and whether they take the tester
+_TESTS = (
+    (test_multiple_sessions, _banner("🔄 Testing Multiple Session Management", 50), True),
+    (test_enhanced_navigation, _banner("🧭 Testing Enhanced Navigation", 40), True),
+    (test_javascript_execution, _banner("⚡ Testing JavaScript Execution", 40), True),
+    (test_page_information, _banner("📄 Testing Page Information", 35), True),
+    (test_enhanced_element_interaction, _banner("🎯 Testing Enhanced Element Interaction", 45), True),
+    (test_error_handling, _banner("🛡️ Testing Enhanced Error Handling", 40), False),
+    (test_performance_features, _banner("⚡ Testing Performance Features", 35), False),
+)
 
 def compare_with_original():
     """Compare our enhanced server with the original angiejones/mcp-selenium."""
     print("\n📊 Comparison with angiejones/mcp-selenium")
     print("=" * 50)
     
-    comparison_data = {
-        "Multiple Sessions": {
-            "Original": "❌ Single session only",
-            "Enhanced": "✅ Multiple concurrent sessions",
-            "Improvement": "🟢 Superior"
-        },
-        "Session Management": {
-            "Original": "❌ No session switching",
-            "Enhanced": "✅ List, switch, manage sessions",
-            "Improvement": "🟢 New Feature"
-        },
-        "Error Handling": {
-            "Original": "⚠️ Basic try-catch",
-            "Enhanced": "✅ Specific exception types",
-            "Improvement": "🟢 Better"
-        },
-        "JavaScript Execution": {
-            "Original": "❌ Not available",
-            "Enhanced": "✅ Execute custom JavaScript",
-            "Improvement": "🟢 New Feature"
-        },
-        "Page Information": {
-            "Original": "❌ Not available",
-            "Enhanced": "✅ Comprehensive page details",
-            "Improvement": "🟢 New Feature"
-        },
-        "Resource Management": {
-            "Original": "⚠️ Basic cleanup",
-            "Enhanced": "✅ Enhanced cleanup and tracking",
-            "Improvement": "🟢 Better"
-        },
-        "Configuration": {
-            "Original": "⚠️ Basic options",
-            "Enhanced": "✅ Window size, session naming",
-            "Improvement": "🟢 Better"
-        }
-    }
-    
-    for feature, data in comparison_data.items():
-        print(f"\n{feature}:")
-        print(f"  Original: {data['Original']}")
-        print(f"  Enhanced: {data['Enhanced']}")
-        print(f"  Status: {data['Improvement']}")
+    print(_CMP_TEXT, end="")
 
-async def main():
+def main():
     """Run all tests."""
     print("🚀 Selenium MCP Server Test Suite")
     print("=" * 60)
     print("Testing improvements over angiejones/mcp-selenium")
     print()
     
-    # Run all tests
-    await test_multiple_sessions()
-    await test_enhanced_navigation()
-    await test_javascript_execution()
-    await test_page_information()
-    await test_enhanced_element_interaction()
-    await test_error_handling()
-    await test_performance_features()
+    # Run all tests against one shared tester, as the pytest fixture does
+    tester = MCPTester()
+    for test, banner, takes_tester in _TESTS:
+        print(banner)
+        if takes_tester:
+            test(tester)
+        else:
+            test()
     
     # Show comparison
     compare_with_original()
@@ -383,4 +429,5 @@ async def main():
     print("4. Enjoy the improved features!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main() 
\ No newline at end of file
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Tool handler tests for Selenium MCP Server
+Drives the real handlers against an in-memory WebDriver stand-in, so they run
+without a browser
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from types import SimpleNamespace
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+import selenium_mcp_server.selenium_mcp_server as server_module
+from selenium_mcp_server.selenium_mcp_server import (
+    SeleniumMCPServer, _BATCH_ACTIONS_JS, _CACHED_MATCH_JS, _FILL_INPUT_JS
+)
+
+
+class FakeElement:
+    """Element that records what was done to it"""
+
+    def __init__(self, tag_name="input"):
+        self.tag_name = tag_name
+        self.keys = []
+        self.cleared = False
+        self.clicks = 0
+
+    def send_keys(self, text):
+        self.keys.append(text)
+
+    def clear(self):
+        self.cleared = True
+
+    def click(self):
+        self.clicks += 1
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """WebDriver stand-in: elements are looked up by locator, scripts are recorded"""
+
+    def __init__(self):
+        self.elements = {}
+        self.scripts = []
+        self.script_result = True
+        self.current_url = "about:blank"
+        self.title = ""
+        self.page_source = ""
+        self.quit_called = False
+        self.finds = 0
+
+    def find_element(self, by, value):
+        self.finds += 1
+        if (by, value) not in self.elements:
+            raise NoSuchElementException(value)
+        return self.elements[(by, value)]
+
+    def execute_async_script(self, script, by, value, wait_ms, *args):
+        return self.elements.get((by, value))
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if script == _CACHED_MATCH_JS:
+            by, value, element = args
+            return self.elements.get((by, value)) is element
+        return self.script_result(*args) if callable(self.script_result) else self.script_result
+
+    def get(self, url):
+        self.current_url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeChromeDriver(FakeDriver):
+    """FakeDriver that also answers the CDP commands used to reset a pooled browser"""
+
+    def __init__(self):
+        super().__init__()
+        self.window_handles = ["main"]
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": "about:blank"}, {"url": "https://example.com/login"}]}
+        return {}
+
+
+async def start_server(driver):
+    """Server with one session running on driver"""
+    server = SeleniumMCPServer()
+    server.launches = 0
+
+    async def launch(browser, options):
+        server.launches += 1
+        return driver
+
+    server._launch_driver = launch
+    result = await server._start_browser({"browser": "chrome", "options": {"headless": True}})
+    assert not result["isError"]
+    return server
+
+
+async def test_send_keys_newline_is_typed():
+    """Text with a newline goes through send_keys so Enter still submits the form"""
+    driver = FakeDriver()
+    element = driver.elements[(By.CSS_SELECTOR, "#q")] = FakeElement()
+    server = await start_server(driver)
+    try:
+        result = await server._send_keys({"by": "css", "value": "#q", "text": "query\n"})
+        assert not result.isError
+        assert element.keys == ["query\n"]
+        assert not any(script == _FILL_INPUT_JS for script, _ in driver.scripts)
+    finally:
+        await server.shutdown()
+
+
+async def test_send_keys_plain_text_is_filled_by_script():
+    """Plain text is set in one script call without key presses"""
+    driver = FakeDriver()
+    element = driver.elements[(By.CSS_SELECTOR, "#q")] = FakeElement()
+    server = await start_server(driver)
+    try:
+        result = await server._send_keys({"by": "css", "value": "#q", "text": "query"})
+        assert not result.isError
+        assert element.keys == []
+        assert [args for script, args in driver.scripts if script == _FILL_INPUT_JS] == [(element, "query", True)]
+    finally:
+        await server.shutdown()
+
+
+async def test_page_info_astral_characters_not_truncated():
+    """A short page with an emoji is reported whole, by script and by the fallback"""
+    driver = FakeDriver()
+    driver.script_result = {"title": "t", "url": "u", "truncated": False, "source": "<p>😀</p>"}
+    server = await start_server(driver)
+    try:
+        result = await server._get_page_info({"include_source": True})
+        info = json.loads(result.content[0].text)
+        assert info["source"] == "<p>😀</p>"
+        assert info["source_truncated"] is False
+
+        def no_scripts(*args):
+            raise WebDriverException("scripts disabled")
+
+        driver.script_result = no_scripts
+        driver.page_source = "<p>😀</p>"
+        result = await server._get_page_info({"include_source": True})
+        info = json.loads(result.content[0].text)
+        assert info["source"] == "<p>😀</p>"
+        assert info["source_truncated"] is False
+    finally:
+        await server.shutdown()
+
+
+async def test_page_info_trims_lone_surrogate():
+    """Trimming to the byte cap drops a lone surrogate instead of failing to encode it"""
+    driver = FakeDriver()
+    driver.script_result = {"title": "t", "url": "u", "truncated": False, "source": "ab\ud83d"}
+    server = await start_server(driver)
+    try:
+        result = await server._get_page_info({"include_source": True, "max_source_bytes": 3})
+        assert not result.isError
+        info = json.loads(result.content[0].text)
+        assert info["source"] == "ab"
+        assert info["source_truncated"] is True
+    finally:
+        await server.shutdown()
+
+
+async def test_cached_element_reused_while_it_still_matches():
+    """A repeated click reuses the cached element after one match check"""
+    driver = FakeDriver()
+    button = driver.elements[(By.CSS_SELECTOR, "#b")] = FakeElement("button")
+    server = await start_server(driver)
+    try:
+        for _ in range(2):
+            result = await server._click_element({"by": "css", "value": "#b"})
+            assert not result.isError
+        assert button.clicks == 2
+        assert driver.finds == 1
+    finally:
+        await server.shutdown()
+
+
+async def test_cached_element_not_reused_after_rerender():
+    """When another node now matches the locator, the click goes to that node"""
+    driver = FakeDriver()
+    old = driver.elements[(By.CSS_SELECTOR, "#b")] = FakeElement("button")
+    server = await start_server(driver)
+    try:
+        await server._click_element({"by": "css", "value": "#b"})
+        new = driver.elements[(By.CSS_SELECTOR, "#b")] = FakeElement("button")
+        result = await server._click_element({"by": "css", "value": "#b"})
+        assert not result.isError
+        assert (old.clicks, new.clicks) == (1, 1)
+    finally:
+        await server.shutdown()
+
+
+async def test_page_info_reports_script_truncation():
+    """The in-page cap's truncated flag reaches the client; without source there is no flag"""
+    driver = FakeDriver()
+    driver.script_result = {"title": "t", "url": "u", "truncated": True, "source": "<html>"}
+    server = await start_server(driver)
+    try:
+        result = await server._get_page_info({"include_source": True, "max_source_bytes": 6})
+        assert json.loads(result.content[0].text)["source_truncated"] is True
+
+        driver.script_result = {"title": "t", "url": "u"}
+        result = await server._get_page_info({})
+        assert "source_truncated" not in json.loads(result.content[0].text)
+    finally:
+        await server.shutdown()
+
+
+async def test_navigate_clears_element_cache():
+    """Elements cached on one page are never reused after navigating"""
+    driver = FakeDriver()
+    driver.elements[(By.CSS_SELECTOR, "#b")] = FakeElement("button")
+    server = await start_server(driver)
+    try:
+        await server._click_element({"by": "css", "value": "#b"})
+        session = server._get_current_session()
+        assert session.element_cache
+
+        await server._navigate({"url": "https://example.com/next"})
+        assert not session.element_cache
+
+        await server._click_element({"by": "css", "value": "#b"})
+        assert driver.finds == 2
+    finally:
+        await server.shutdown()
+
+
+async def test_navigate_honours_page_load_strategy():
+    """eager stops waiting at DOMContentLoaded, none does not wait at all"""
+    driver = FakeDriver()
+    driver.script_result = "interactive"
+    server = SeleniumMCPServer()
+
+    async def launch(browser, options):
+        return driver
+
+    server._launch_driver = launch
+    try:
+        for strategy, checks in (("eager", 1), ("none", 0)):
+            await server._start_browser({"browser": "chrome", "options": {"page_load_strategy": strategy}})
+            driver.scripts.clear()
+            result = await server._navigate({"url": "https://example.com/"})
+            assert not result["isError"]
+            assert len(driver.scripts) == checks
+    finally:
+        await server.shutdown()
+
+
+async def test_closed_sessions_quit_by_default():
+    """Without a pool size, closing a session quits its browser"""
+    driver = FakeChromeDriver()
+    server = await start_server(driver)
+    try:
+        result = await server._close_session({})
+        assert not result.isError
+        assert driver.quit_called
+        assert driver.cdp == []
+    finally:
+        await server.shutdown()
+
+
+async def test_pooled_chromium_driver_is_reset_and_reused(monkeypatch):
+    """A pooled Chromium browser is wiped through CDP and handed to the next session"""
+    monkeypatch.setattr(server_module, "_DRIVER_POOL_SIZE", 1)
+    driver = FakeChromeDriver()
+    server = await start_server(driver)
+    try:
+        await server._close_session({})
+        assert not driver.quit_called
+        commands = [cmd for cmd, _ in driver.cdp]
+        assert ("Storage.clearDataForOrigin", {"origin": "https://example.com", "storageTypes": "all"}) in driver.cdp
+        assert "Network.clearBrowserCookies" in commands
+        assert "Page.resetNavigationHistory" in commands
+        assert driver.current_url == "about:blank"
+
+        result = await server._start_browser({"browser": "chrome", "options": {"headless": True}})
+        assert not result["isError"]
+        assert server.launches == 1
+        assert server._get_current_session().driver is driver
+    finally:
+        await server.shutdown()
+    assert driver.quit_called
+
+
+async def test_driver_without_cdp_is_not_pooled(monkeypatch):
+    """Browsers that cannot be fully reset are quit even when pooling is on"""
+    monkeypatch.setattr(server_module, "_DRIVER_POOL_SIZE", 1)
+    driver = FakeDriver()
+    server = await start_server(driver)
+    try:
+        await server._close_session({})
+        assert driver.quit_called
+        assert not any(server._driver_pool.values())
+    finally:
+        await server.shutdown()
+
+
+async def test_session_cap_closes_oldest_session(monkeypatch):
+    """At the cap the oldest session is closed, even when its browser has already died"""
+    monkeypatch.setattr(server_module, "_MAX_SESSIONS", 1)
+    dead = FakeDriver()
+
+    def crash():
+        raise WebDriverException("browser is gone")
+
+    dead.quit = crash
+    server = await start_server(dead)
+    fresh = FakeDriver()
+
+    async def launch(browser, options):
+        return fresh
+
+    server._launch_driver = launch
+    try:
+        result = await server._start_browser({"browser": "chrome", "options": {"headless": True}})
+        assert not result["isError"]
+        assert len(server.sessions) == 1
+        assert server._get_current_session().driver is fresh
+    finally:
+        await server.shutdown()
+    assert fresh.quit_called
+
+
+async def test_idle_sessions_are_evicted():
+    """Only sessions idle for longer than the limit are closed"""
+    idle, active = FakeDriver(), FakeDriver()
+    server = await start_server(idle)
+    idle_id = server.current_session_id
+
+    async def launch(browser, options):
+        return active
+
+    server._launch_driver = launch
+    try:
+        await server._start_browser({"browser": "chrome", "options": {"headless": True}})
+        server.sessions[idle_id].last_activity -= 10_000_000_000
+        await server._evict_idle(5_000_000_000)
+        assert idle_id not in server.sessions
+        assert idle.quit_called
+        assert len(server.sessions) == 1
+        assert not active.quit_called
+    finally:
+        await server.shutdown()
+
+
+async def test_batch_actions_returns_step_results():
+    """Each step's result is returned in order"""
+    driver = FakeDriver()
+    driver.script_result = {"results": [True, True, True, "Done"]}
+    server = await start_server(driver)
+    try:
+        actions = [
+            {"op": "find", "by": "css", "value": "#go"},
+            {"op": "click"},
+            {"op": "find", "by": "id", "value": "out"},
+            {"op": "text"},
+        ]
+        result = await server._batch_actions({"actions": actions})
+        assert not result["isError"]
+        assert result["structuredContent"]["data"]["results"] == [True, True, True, "Done"]
+        steps = [
+            {"op": "find", "by": By.CSS_SELECTOR, "value": "#go"},
+            {"op": "click"},
+            {"op": "find", "by": By.ID, "value": "out"},
+            {"op": "text"},
+        ]
+        assert driver.scripts == [(_BATCH_ACTIONS_JS, (steps,))]
+    finally:
+        await server.shutdown()
+
+
+async def test_batch_actions_reports_failed_step():
+    """A step the script could not run fails the batch and names the step"""
+    driver = FakeDriver()
+    driver.script_result = {"results": [True], "failed_at": 1, "error": "Element not found: #missing"}
+    server = await start_server(driver)
+    try:
+        result = await server._batch_actions({"actions": [
+            {"op": "find", "value": "#go"}, {"op": "find", "value": "#missing"}
+        ]})
+        assert result["isError"]
+        assert result["structuredContent"]["error_code"] == "BATCH_STEP_FAILED"
+        assert "step 1: Element not found: #missing" in result["content"][0]["text"]
+    finally:
+        await server.shutdown()
+
+
+async def test_batch_actions_reports_script_errors():
+    """A JavaScript exception thrown by a step, and an empty batch, are errors"""
+    driver = FakeDriver()
+
+    def throw(*args):
+        raise JavascriptException("el.click is not a function")
+
+    driver.script_result = throw
+    server = await start_server(driver)
+    try:
+        result = await server._batch_actions({"actions": [{"op": "find", "value": "#go"}, {"op": "click"}]})
+        assert result["isError"]
+        assert result["structuredContent"]["error_code"] == "BATCH_ERROR"
+        assert result["structuredContent"]["error_type"] == "JavascriptException"
+
+        result = await server._batch_actions({"actions": []})
+        assert result["structuredContent"]["error_code"] == "MISSING_ACTIONS"
+    finally:
+        await server.shutdown()
+
+
+# A two-element document for running _BATCH_ACTIONS_JS itself under node
+_NODE_DOCUMENT = """
+var clicked = [], window = {}, Node = {ELEMENT_NODE: 1}, XPathResult = {FIRST_ORDERED_NODE_TYPE: 9};
+function node(id, text) {
+    return {nodeType: 1, innerText: text, click: function () { clicked.push(id); },
+            getAttribute: function (name) { return name + "=" + id; }};
+}
+var nodes = {"#go": node("go", "Go"), "#out": node("out", "Done"), "//p/text()": {nodeType: 3}};
+var document = {
+    querySelector: function (value) { return nodes[value] || null; },
+    getElementById: function (value) { return nodes["#" + value] || null; },
+    createExpression: function (value) {
+        return {evaluate: function () { return {singleNodeValue: nodes[value] || null}; }};
+    }
+};
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node to run the page script")
+def test_batch_actions_script():
+    """The page script runs the steps, and stops at the first one it cannot run"""
+    batches = [
+        [{"op": "find", "value": "#go"}, {"op": "click"},
+         {"op": "find", "by": By.ID, "value": "out"}, {"op": "text"}, {"op": "attribute", "name": "role"}],
+        [{"op": "find", "value": "#go"}, {"op": "find", "value": "#missing"}, {"op": "click"}],
+        [{"op": "click"}],
+        [{"op": "find", "value": "#go"}, {"op": "hover"}],
+        [{"op": "find", "by": By.XPATH, "value": "//p/text()"}, {"op": "click"}],
+    ]
+    program = _NODE_DOCUMENT + "var run = function () {" + _BATCH_ACTIONS_JS + "};\n"
+    program += "console.log(JSON.stringify({outcomes: %s.map(function (steps) { return run.apply(null, [steps]); }), clicked: clicked}));" % json.dumps(batches)
+    output = json.loads(subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True).stdout)
+
+    assert output["outcomes"] == [
+        {"results": [True, True, True, "Done", "role=out"]},
+        {"results": [True], "failed_at": 1, "error": "Element not found: #missing"},
+        {"results": [], "failed_at": 0, "error": "No element selected; add a 'find' step first"},
+        {"results": [True], "failed_at": 1, "error": "Unknown op: hover"},
+        {"results": [], "failed_at": 0, "error": "Element not found: //p/text()"},
+    ]
+    assert output["clicked"] == ["go"]